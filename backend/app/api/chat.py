@@ -21,7 +21,7 @@ if env_path.exists():
     load_dotenv(env_path)
 
 from app.core.llm import get_llm, setup_llm_cache
-from app.services.vector_store import VectorStore
+from app.services.vector_store import VectorStore, get_default_vector_store
 from app.services.pdf_ingest import ingest_pdf
 
 
@@ -106,8 +106,8 @@ def get_vector_store() -> VectorStore:
     global _vector_store
     
     if _vector_store is None:
-        # Initialize vector store
-        _vector_store = VectorStore()
+        # Reuse the process-wide store (shared with rule extraction)
+        _vector_store = get_default_vector_store()
         
         # Index PDFs (for MVP, we index on startup)
         # In production, you might want to do this separately or cache it
@@ -117,9 +117,14 @@ def get_vector_store() -> VectorStore:
         if pdf_files:
             print(f"Indexing {len(pdf_files)} PDF files...")
             for pdf_path in pdf_files:
+                pdf_key = str(pdf_path.resolve())
+                if pdf_key in _vector_store.indexed_sources:
+                    print(f"  ✓ {pdf_path.name} already indexed")
+                    continue
                 try:
                     chunks = ingest_pdf(str(pdf_path))
                     _vector_store.add_documents(chunks)
+                    _vector_store.indexed_sources.add(pdf_key)
                     print(f"  ✓ Indexed {pdf_path.name} ({len(chunks)} chunks)")
                 except Exception as e:
                     print(f"  ✗ Failed to index {pdf_path.name}: {e}")
@@ -33,7 +33,8 @@ def get_issues() -> List[Issue]:
     3. Returns list of Issue objects for any violations found
     
     **Design decisions:**
-    - Loads data fresh on each request (CSV files may change)
+    - Loads data on each request, but load_design() and check_compliance() are
+      cached (CSV edits are picked up via file modification time)
     - Uses `response_model=List[Issue]` for automatic Pydantic serialization
     - Returns empty list if design is fully compliant
     
@@ -0,0 +1,38 @@
+"""
+Connection-pooled HTTP clients for OpenAI calls.
+
+Each OpenAI-backed object (ChatOpenAI, OpenAIEmbeddings) otherwise builds its
+own httpx client with default pool limits, so concurrent callers (evaluation
+runs, several retrievers side by side) open and tear down connections
+independently. Creating one tuned client pair and passing it to every
+component keeps connections warm and bounded in one pool.
+
+Callers own the clients' lifecycle: close them when done
+(``client.close()`` / ``await async_client.aclose()``).
+
+Example:
+    http_client = create_http_client()
+    http_async_client = create_async_http_client()
+    llm = get_llm(http_client=http_client, http_async_client=http_async_client)
+    vs = VectorStore(http_client=http_client, http_async_client=http_async_client)
+"""
+import httpx
+
+# Pool sized for concurrent evaluation/ingest traffic to a single API host
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(30.0)
+
+
+def create_http_client() -> httpx.Client:
+    """Create a pooled sync httpx client (for invoke/embed_documents)."""
+    return httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    Create a pooled async httpx client (for ainvoke/aembed_documents).
+
+    An AsyncClient is bound to the event loop it is first used on, so share
+    it only between coroutines running on the same loop.
+    """
+    return httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
@@ -5,8 +5,11 @@ Adapted from day_12 lesson patterns.
 """
 import os
 from typing import Optional
+
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models import BaseChatModel
+from langchain_core.rate_limiters import BaseRateLimiter
 
 # TODO: Add Gemini/Claude support when needed
 # from langchain_google_genai import ChatGoogleGenerativeAI
@@ -16,7 +19,10 @@ from langchain_core.language_models import BaseChatModel
 def get_llm(
     provider: str = "openai",
     model_name: Optional[str] = None,
-    temperature: float = 0.0
+    temperature: float = 0.0,
+    http_client: Optional[httpx.Client] = None,
+    http_async_client: Optional[httpx.AsyncClient] = None,
+    rate_limiter: Optional[BaseRateLimiter] = None
 ) -> BaseChatModel:
     """
     Get LLM client for specified provider.
@@ -27,6 +33,10 @@ def get_llm(
         provider: "openai", "gemini", or "claude" (future)
         model_name: Override default model name
         temperature: Model temperature
+        http_client: Optional shared sync httpx client (see app.core.http_clients)
+        http_async_client: Optional shared async httpx client
+        rate_limiter: Optional client-side rate limiter (e.g. InMemoryRateLimiter,
+                      a token bucket) applied before every model request
     
     Returns:
         LangChain chat model instance
@@ -39,7 +49,14 @@ def get_llm(
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
         model = model_name or os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
-        return ChatOpenAI(model=model, temperature=temperature, api_key=api_key)
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            rate_limiter=rate_limiter
+        )
     
     # Future: Add Gemini/Claude support
     # elif provider == "gemini":
@@ -0,0 +1,38 @@
+"""
+Logging configuration for the backend.
+
+Services log through module-level loggers (``logging.getLogger(__name__)``);
+the handler is configured once here so production can raise the level and
+skip per-rule debug output entirely.
+"""
+import logging
+import os
+from typing import Optional
+
+# Guard so repeated calls (e.g. app reloads) don't stack handlers
+_logging_configured = False
+
+
+def setup_logging(level: Optional[str] = None) -> None:
+    """
+    Configure the root ``app`` logger once.
+
+    Args:
+        level: Log level name (e.g. "DEBUG", "INFO"). Defaults to the
+               LOG_LEVEL environment variable, or "INFO" if unset.
+    """
+    global _logging_configured
+
+    if _logging_configured:
+        return
+
+    level_name = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+
+    app_logger = logging.getLogger("app")
+    app_logger.addHandler(handler)
+    app_logger.setLevel(level_name)
+
+    _logging_configured = True
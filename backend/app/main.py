@@ -3,12 +3,19 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from app.core.logging import setup_logging
 from app.api.chat import router as chat_router
 
 from app.api.issues import router as issues_router
 
-app = FastAPI(title="Code-Aware Space Planning Copilot")
+setup_logging()
+
+# orjson for every JSON API response (issues lists, chat answers + citations)
+app = FastAPI(
+    title="Code-Aware Space Planning Copilot",
+    default_response_class=ORJSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from typing import List
 
 from app.models.domain import Room, Door, Rule, Issue
@@ -122,6 +124,37 @@ def check_door_compliance(door: Door, rules: List[Rule]) -> List[Issue]:
     return issues
 
 
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+# check_compliance() is pure in (rooms, doors, rules) and runs on every
+# /api/issues and /api/issues/summary request, so recent results are kept
+# in a small LRU keyed by the inputs' field values
+_COMPLIANCE_CACHE_SIZE = 8
+_compliance_cache: "OrderedDict[tuple, tuple[Issue, ...]]" = OrderedDict()
+_compliance_cache_lock = threading.Lock()
+
+
+def _compliance_cache_key(rooms: List[Room], doors: List[Door], rules: List[Rule]) -> tuple:
+    """
+    Hashable snapshot of the compliance inputs.
+
+    Built from each model's field values (not object identity), so an edited
+    room/door/rule is a cache miss even if the same object is passed again.
+    """
+    return tuple(
+        tuple(tuple(vars(model).values()) for model in models)
+        for models in (rooms, doors, rules)
+    )
+
+
+def clear_compliance_cache() -> None:
+    """Clear cached check_compliance() results (e.g. in tests)."""
+    with _compliance_cache_lock:
+        _compliance_cache.clear()
+
+
 # ============================================================================
 # Main Compliance Checker
 # ============================================================================
@@ -141,6 +174,9 @@ def check_compliance(
     3. Checks each door against door rules
     4. Returns all violations as Issue objects
     
+    Results are memoized (LRU of the last few inputs): repeated calls with
+    unchanged rooms/doors/rules return the cached issues.
+    
     Args:
         rooms: List of Room objects to check
         doors: List of Door objects to check
@@ -166,6 +202,13 @@ def check_compliance(
     if rules is None:
         rules = get_all_rules()
     
+    cache_key = _compliance_cache_key(rooms, doors, rules)
+    with _compliance_cache_lock:
+        cached = _compliance_cache.get(cache_key)
+        if cached is not None:
+            _compliance_cache.move_to_end(cache_key)
+            return list(cached)
+    
     all_issues = []
     
     # Check all rooms
@@ -178,6 +221,11 @@ def check_compliance(
         door_issues = check_door_compliance(door, rules)
         all_issues.extend(door_issues)
     
+    with _compliance_cache_lock:
+        _compliance_cache[cache_key] = tuple(all_issues)
+        if len(_compliance_cache) > _COMPLIANCE_CACHE_SIZE:
+            _compliance_cache.popitem(last=False)
+    
     return all_issues
 
 
@@ -36,8 +36,7 @@ def _get_cache_key(csv_path: Path) -> tuple:
 # Room Loader
 # ============================================================================
 
-@lru_cache(maxsize=2) # Cache up to 2 different file paths
-def load_rooms(csv_path: Path | None = None) -> List[Room]:
+def load_rooms(csv_path: Path | None = None) -> tuple[Room, ...]:
     """
     Load rooms from CSV file into Room models.
 
@@ -67,8 +66,16 @@ def load_rooms(csv_path: Path | None = None) -> List[Room]:
     csv_path = csv_path.resolve()
 
     # Get cache key (includes modification time for invalidation)
-    cache_key = _get_cache_key(csv_path)
+    return _load_rooms_cached(csv_path, _get_cache_key(csv_path))
+
+
+@lru_cache(maxsize=2) # Cache up to 2 different file paths
+def _load_rooms_cached(csv_path: Path, cache_key: tuple) -> tuple[Room, ...]:
+    """
+    Parse rooms.csv (cached per path + modification time).
 
+    cache_key is only part of the lru_cache key: a new mtime is a cache miss.
+    """
     rooms = []
 
     try:
@@ -223,18 +230,47 @@ def load_design(
         rooms, doors = load_design()
         # Now you have both datasets ready to use, validated
     """
+    rooms_path = (rooms_path or DATA_DIR / "rooms.csv").resolve()
+    doors_path = (doors_path or DATA_DIR / "doors.csv").resolve()
+
+    # Cached per (paths, mtimes): /api/issues and /api/issues/summary call this
+    # on every request, so unchanged CSVs are parsed and validated once
+    rooms_tuple, doors_tuple = _load_design_cached(
+        rooms_path,
+        doors_path,
+        valid_references,
+        _get_cache_key(rooms_path),
+        _get_cache_key(doors_path)
+    )
+
+    # Return fresh lists so callers can't mutate the cached tuples
+    return list(rooms_tuple), list(doors_tuple)
+
+
+@lru_cache(maxsize=2)
+def _load_design_cached(
+    rooms_path: Path,
+    doors_path: Path,
+    valid_references: bool,
+    rooms_cache_key: tuple,
+    doors_cache_key: tuple
+) -> tuple[tuple[Room, ...], tuple[Door, ...]]:
+    """
+    Load and validate rooms + doors (cached per paths + modification times).
+
+    The cache keys are only part of the lru_cache key: editing either CSV is
+    a cache miss.
+    """
     # Loads room first
     rooms_tuple = load_rooms(rooms_path)
-    rooms = list(rooms_tuple)
 
     # Build set of room IDs for validation
-    room_ids = {room.id for room in rooms} if valid_references else None
+    room_ids = {room.id for room in rooms_tuple} if valid_references else None
 
     # Load doors with validation
     doors_tuple = load_doors(doors_path, room_ids=room_ids)
-    doors = list(doors_tuple)
     
-    return rooms, doors
+    return rooms_tuple, doors_tuple
 
 # ============================================================================
 # Cache Management
@@ -242,7 +278,7 @@ def load_design(
 
 def clear_cache():
     """
-    Clear the LRU cache for load_rooms and load_doors.
+    Clear the LRU caches for load_rooms and load_design.
 
     Useful for testing or when you want to force a reload.
 
@@ -253,8 +289,8 @@ def clear_cache():
         load_rooms()    # Third call - reads from file again
     """
 
-    load_rooms.cache_clear()
-    load_doors.cache_clear()
+    _load_rooms_cached.cache_clear()
+    _load_design_cached.cache_clear()
 
 # ============================================================================
 # Future: URL/Remote Loading
@@ -0,0 +1,171 @@
+"""
+Embedding cache storage: ByteStores for CacheBackedEmbeddings.
+
+- SQLiteByteStore: LocalFileStore writes one small file per cached embedding,
+  so a warm ingest opens and stats thousands of files. This keeps every entry
+  in a single WAL-mode database file with indexed (primary key) lookups.
+- Float16ByteStore: stores vectors as packed float16 instead of JSON text.
+"""
+import sqlite3
+import struct
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import orjson
+from langchain_core.stores import ByteStore
+
+# Float16ByteStore record header: vector dimension as little-endian uint16
+_DIM_HEADER = struct.Struct("<H")
+
+
+class SQLiteByteStore(ByteStore):
+    """
+    LangChain ByteStore backed by a single SQLite table.
+
+    Drop-in replacement for LocalFileStore in
+    CacheBackedEmbeddings.from_bytes_store(). The connection is shared across
+    threads (async callers run mget/mset in an executor) and guarded by a lock.
+
+    Example:
+        store = SQLiteByteStore("./cache/embeddings/embeddings.db")
+        store.mset([("key", b"value")])
+        store.mget(["key"])  # [b"value"]
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Open (or create) the SQLite database.
+
+        Args:
+            db_path: Path to the database file (parent directory must exist)
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,  # autocommit; batches use explicit transactions
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Get values for keys (None for missing keys), in key order."""
+        if not keys:
+            return []
+
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit on large batches
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start:start + 500])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM embeddings WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+        return [found.get(key) for key in keys]
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, bytes]]) -> None:
+        """Insert or overwrite key/value pairs in one transaction."""
+        if not key_value_pairs:
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, value) VALUES (?, ?)",
+                    key_value_pairs
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        """Delete keys (missing keys are ignored)."""
+        if not keys:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM embeddings WHERE key = ?",
+                [(key,) for key in keys]
+            )
+
+    def yield_keys(self, *, prefix: Optional[str] = None) -> Iterator[str]:
+        """Yield stored keys, optionally only those starting with prefix."""
+        with self._lock:
+            if prefix is None:
+                rows = self._conn.execute("SELECT key FROM embeddings").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT key FROM embeddings WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix)
+                ).fetchall()
+        for (key,) in rows:
+            yield key
+
+
+class Float16ByteStore(ByteStore):
+    """
+    ByteStore wrapper that stores embedding vectors as float16.
+
+    LangChain's CacheBackedEmbeddings serializes vectors as JSON text (tens of
+    bytes per float). This wrapper decodes those JSON values on mset and stores
+    ``[dim: uint16][dim x float16]`` in the inner store instead (~12x smaller
+    than JSON, 2x smaller than float32); mget rebuilds the JSON the cache
+    expects.
+
+    Precision tradeoff: float16 keeps ~3 significant digits (relative error
+    ~1e-3). Cosine similarity between normalized embeddings is robust to that
+    noise, so ranking is effectively unchanged, but cached vectors are not
+    bit-identical to what the API returned.
+
+    Example:
+        store = Float16ByteStore(SQLiteByteStore("./cache/embeddings/embeddings.db"))
+    """
+
+    def __init__(self, store: ByteStore):
+        """
+        Args:
+            store: Inner ByteStore holding the packed float16 records
+        """
+        self.store = store
+
+    @staticmethod
+    def _encode(value: bytes) -> bytes:
+        vector = np.asarray(orjson.loads(value), dtype=np.float32)
+        return _DIM_HEADER.pack(vector.shape[0]) + vector.astype(np.float16).tobytes()
+
+    @staticmethod
+    def _decode(record: bytes) -> bytes:
+        (dim,) = _DIM_HEADER.unpack_from(record)
+        vector = np.frombuffer(record, dtype=np.float16, count=dim, offset=_DIM_HEADER.size)
+        return orjson.dumps(vector.astype(np.float32).tolist())
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Get JSON-encoded vectors for keys (None for missing keys)."""
+        return [
+            None if record is None else self._decode(record)
+            for record in self.store.mget(keys)
+        ]
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, bytes]]) -> None:
+        """Store JSON-encoded vectors as packed float16."""
+        self.store.mset([(key, self._encode(value)) for key, value in key_value_pairs])
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        """Delete keys from the inner store."""
+        self.store.mdelete(keys)
+
+    def yield_keys(self, *, prefix: Optional[str] = None) -> Iterator[str]:
+        """Yield keys from the inner store."""
+        yield from self.store.yield_keys(prefix=prefix)
@@ -3,7 +3,11 @@ PDF ingestion service: Load and chunk PDF documents.
 
 Adapted from day_13 and day_9_A2A lesson patterns.
 """
+import hashlib
+import os
+import pickle
 import re
+import tempfile
 from pathlib import Path
 from typing import List, Optional
 from langchain_community.document_loaders import PyMuPDFLoader
@@ -204,10 +208,64 @@ def chunk_documents(
     return chunks
 
 
+# Bump when chunk_documents()/ingest_pdf() output changes, to invalidate cached chunks
+INGEST_CACHE_VERSION = 1
+
+
+def file_sha256(file_path: str | Path) -> str:
+    """
+    SHA-256 hex digest of a file's contents (read in 1 MB blocks).
+    
+    Used as a content-based cache key for derived data (ingested chunks,
+    extracted rules): an edited PDF is a cache miss, a copied one is not.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _ingest_cache_key(file_path: Path, chunk_size: int, chunk_overlap: int) -> str:
+    """
+    Cache key for ingest_pdf(): PDF content hash + chunking params.
+    
+    The file stem is included because it becomes the chunks' "source" metadata.
+    """
+    key = f"{file_sha256(file_path)}|{file_path.stem}|{chunk_size}|{chunk_overlap}|v{INGEST_CACHE_VERSION}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _load_cached_chunks(cache_path: Path) -> Optional[List[Document]]:
+    """Load pickled chunks, or None if missing/unreadable (treated as a miss)."""
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable ingest cache {cache_path.name}: {e}")
+        return None
+
+
+def _save_cached_chunks(cache_path: Path, chunks: List[Document]) -> None:
+    """Pickle chunks atomically (write temp file, then rename)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(chunks, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
 def ingest_pdf(
     file_path: str | Path,
     chunk_size: int = 1000,
-    chunk_overlap: int = 100
+    chunk_overlap: int = 100,
+    cache_dir: Optional[str | Path] = "./cache/ingest"
 ) -> List[Document]:
     """
     Complete PDF ingestion: load + chunk with enhanced metadata.
@@ -215,10 +273,16 @@ def ingest_pdf(
     Convenience function combining load_pdf + chunk_documents.
     Adds source, page numbers, and section numbers to chunk metadata.
     
+    PDF parsing and splitting are deterministic for a given file, so the
+    resulting chunks are cached on disk (pickle) keyed by the PDF's sha256
+    plus chunk_size/chunk_overlap. Re-runs on an unchanged PDF skip parsing
+    entirely; changing the file or the chunk params is a cache miss.
+    
     Args:
         file_path: Path to PDF file
         chunk_size: Target chunk size
         chunk_overlap: Overlap between chunks
+        cache_dir: Directory for cached chunks (None disables the cache)
     
     Returns:
         List of chunked Document objects ready for embedding with metadata:
@@ -229,6 +293,14 @@ def ingest_pdf(
         - page: Preferred page number (document page if available, otherwise PDF page)
         - section: Section number if found (e.g., "5.2.3") or None
     """
+    cache_path = None
+    if cache_dir is not None:
+        key = _ingest_cache_key(Path(file_path), chunk_size, chunk_overlap)
+        cache_path = Path(cache_dir) / f"{key}.pkl"
+        cached = _load_cached_chunks(cache_path)
+        if cached is not None:
+            return cached
+    
     documents = load_pdf(file_path)
     chunks = chunk_documents(documents, chunk_size, chunk_overlap)
     
@@ -239,4 +311,7 @@ def ingest_pdf(
         chunk.metadata["chunk_index"] = i
         # page and section are already set by chunk_documents()
     
+    if cache_path is not None:
+        _save_cached_chunks(cache_path, chunks)
+    
     return chunks
\ No newline at end of file
@@ -3,9 +3,13 @@ Rule extraction service: Extract structured rules from building code PDFs using
 
 MVP core feature - extracts rules from PDFs for compliance checking.
 """
+import asyncio
+import logging
 import os
+import re
 from typing import List
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
@@ -15,6 +19,8 @@ from app.core.llm import get_llm, setup_llm_cache
 from app.models.domain import Rule, ProjectContext
 from app.services.vector_store import VectorStore
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / ".env"
 if env_path.exists():
@@ -33,70 +39,45 @@ if not _setup_cache_done:
     setup_llm_cache(cache_type="memory")  # Use "sqlite" for production
     _setup_cache_done = True
 
-def extract_rules_from_pdf(
-    pdf_path: str | Path,
-    vector_store: VectorStore,
-    project_context: ProjectContext,
-    max_rules: int = 20
-) -> List[Rule]:
-    """
-    Extract structured rules from building code PDF using LLM.
-    
-    Process:
-    1. Load PDF and add to vector store (if not already added)
-    2. Use RAG to find relevant code sections
-    3. Use LLM with structured output to extract Rule objects
-    
-    Args:
-        pdf_path: Path to building code PDF
-        vector_store: VectorStore instance with PDF indexed
-        max_rules: Maximum number of rules to extract
-    
-    Returns:
-        List of Rule objects extracted from PDF
-    """
-    from app.services.pdf_ingest import ingest_pdf
-    
-    # Load and index PDF if needed
-    # TODO: Check if already indexed (future optimization)
-    chunks = ingest_pdf(pdf_path)
-    vector_store.add_documents(chunks)
-    
-    # Get retriever (uses BM25-only by default, validated best)
-    retriever = vector_store.get_retriever(k=10)
-    
-    # Build project context summary for prompt
-    context_summary = f"""
-PROJECT CONTEXT:
-- Building type: {project_context.building_type}
-- Number of stories: {project_context.number_of_stories}
-- Occupancy: {project_context.occupancy}
-- Building classification: {project_context.building_classification}
-- Requires accessibility: {project_context.requires_accessibility}
-- Requires fire-rated: {project_context.requires_fire_rated}
-"""
-    
-    # Build exclusion list based on context
-    exclusions = []
-    if project_context.building_type == "residential":
-        exclusions.append("- Commercial, industrial, or public building rules")
-        exclusions.append("- Rules for multi-tenant or commercial occupancy")
-    if project_context.number_of_stories == "single-story":
-        exclusions.append("- Fire exit doors and stairwell requirements")
-        exclusions.append("- Emergency exit requirements for multi-story buildings")
-        exclusions.append("- Rules specific to multi-story buildings")
-    if not project_context.requires_accessibility:
-        exclusions.append("- Public accessibility requirements (ADA, universal design)")
-        exclusions.append("- Accessible door widths (unless standard residential doors)")
-    if not project_context.requires_fire_rated:
-        exclusions.append("- Fire-rated door requirements")
-        exclusions.append("- Fire exit requirements")
+# Separator between retrieved documents in the LLM context
+DOC_SEPARATOR = "\n\n---\n\n"
+
+
+def _format_doc(doc) -> str:
+    """Format a single retrieved document with its source and page citation."""
+    metadata = doc.metadata
     
-    exclusion_text = "\n".join(exclusions) if exclusions else "- None (all rules applicable)"
+    # Prefer document page number if available, otherwise use PDF page
+    page_document = metadata.get('page_document')
+    if page_document:
+        page = f"{page_document} (document page)"
+    else:
+        page_pdf = metadata.get('page_pdf')
+        page = f"{page_pdf} (PDF page)" if page_pdf else '?'
     
-    # Prompt for rule extraction
-    extraction_prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are an expert at extracting building code rules from documents.
+    return f"[Source: {metadata.get('source', 'Unknown')}, Page: {page}]\n{doc.page_content}"
+
+
+def format_docs(docs) -> str:
+    """Join retrieved documents into a single context string for the LLM."""
+    return DOC_SEPARATOR.join(_format_doc(doc) for doc in docs)
+
+
+# ============================================================================
+# Extraction Prompt (built once, shared by sync and async extraction)
+# ============================================================================
+
+# General query used to find rule-like sections in the indexed codes
+EXTRACTION_QUERY = "minimum area requirements room dimensions door width accessibility"
+
+# Seeded rule IDs that extracted rules must not reuse (see rules_seed.py)
+SEEDED_RULE_IDS = {"R001", "R002", "D001", "D002"}
+
+# Max concurrent LLM calls in async extraction (stay under OpenAI TPM limits)
+MAX_CONCURRENT_EXTRACTIONS = 8
+
+EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert at extracting building code rules from documents.
 
 {project_context}
 
@@ -126,7 +107,7 @@ For each rule, extract:
 - Code reference (section number, if available)
 
 Return only rules that have clear, measurable requirements. Use SI units (m² for area, mm for width)."""),
-        ("human", """Extract building code rules from this context:
+    ("human", """Extract building code rules from this context:
 
 {context}
 
@@ -142,112 +123,231 @@ Extract up to {max_rules} rules. Return as a JSON array of Rule objects with the
 - rule_text: Text description (optional)
 
 Format as JSON array. Only include rules for rooms or doors that match the project context.""")
-    ])
+])
+
+
+# ============================================================================
+# Extraction Helpers
+# ============================================================================
+
+def _index_pdf(pdf_path: str | Path, vector_store: VectorStore) -> None:
+    """Load and index a PDF into the vector store unless it is already indexed."""
+    from app.services.pdf_ingest import ingest_pdf
     
-    # LLM with structured output
-    llm = get_llm(provider="openai", temperature=0.0)
+    pdf_key = str(Path(pdf_path).resolve())
+    if pdf_key not in vector_store.indexed_sources:
+        chunks = ingest_pdf(pdf_path)
+        vector_store.add_documents(chunks)
+        vector_store.indexed_sources.add(pdf_key)
+
+
+def _build_prompt_inputs(project_context: ProjectContext, max_rules: int) -> dict:
+    """
+    Build the extraction prompt variables for a project context.
     
-    # Create chain: retrieve context → format → LLM → parse
-    def format_docs(docs):
-        formatted = []
-        for doc in docs:
-            source = doc.metadata.get('source', 'Unknown')
-            
-            # Prefer document page number if available, otherwise use PDF page
-            page_document = doc.metadata.get('page_document')
-            page_pdf = doc.metadata.get('page_pdf')
+    Everything except the retrieved ``context`` is filled in here.
+    """
+    # Build project context summary for prompt
+    context_summary = f"""
+PROJECT CONTEXT:
+- Building type: {project_context.building_type}
+- Number of stories: {project_context.number_of_stories}
+- Occupancy: {project_context.occupancy}
+- Building classification: {project_context.building_classification}
+- Requires accessibility: {project_context.requires_accessibility}
+- Requires fire-rated: {project_context.requires_fire_rated}
+"""
+    
+    # Build exclusion list based on context
+    exclusions = []
+    if project_context.building_type == "residential":
+        exclusions.append("- Commercial, industrial, or public building rules")
+        exclusions.append("- Rules for multi-tenant or commercial occupancy")
+    if project_context.number_of_stories == "single-story":
+        exclusions.append("- Fire exit doors and stairwell requirements")
+        exclusions.append("- Emergency exit requirements for multi-story buildings")
+        exclusions.append("- Rules specific to multi-story buildings")
+    if not project_context.requires_accessibility:
+        exclusions.append("- Public accessibility requirements (ADA, universal design)")
+        exclusions.append("- Accessible door widths (unless standard residential doors)")
+    if not project_context.requires_fire_rated:
+        exclusions.append("- Fire-rated door requirements")
+        exclusions.append("- Fire exit requirements")
+    
+    exclusion_text = "\n".join(exclusions) if exclusions else "- None (all rules applicable)"
+    
+    return {
+        "max_rules": max_rules,
+        "project_context": context_summary,
+        "building_type": project_context.building_type,
+        "number_of_stories": project_context.number_of_stories,
+        "occupancy": project_context.occupancy,
+        "building_classification": project_context.building_classification,
+        "exclusions": exclusion_text
+    }
+
+
+def _parse_rules(answer: str) -> List[Rule]:
+    """
+    Parse the LLM answer into validated Rule objects.
+    
+    Parses JSON manually (LLM returns a JSON string); orjson handles the
+    potentially large rule array faster than stdlib json.
+    """
+    # Extract JSON array from response
+    json_match = re.search(r'\[.*\]', answer, re.DOTALL)
+    if json_match:
+        rules_data = orjson.loads(json_match.group())
+        rules = []
+        for rule_data in rules_data:
+            # Validate and filter element_type (must be "room" or "door")
+            element_type = rule_data.get("element_type", "room")
+            if element_type not in ["room", "door"]:
+                # Skip invalid element types
+                logger.warning("Skipping rule with invalid element_type: %s", element_type)
+                continue
             
-            # Format page with explicit type indication
-            if page_document:
-                page = f"{page_document} (document page)"
-            elif page_pdf:
-                page = f"{page_pdf} (PDF page)"
-            else:
-                page = '?'
+            # Validate rule_type matches element_type
+            rule_type = rule_data.get("rule_type", "text")
+            if element_type == "room" and rule_type not in ["area_min", "text"]:
+                # Room rules should be area_min or text, not width_min
+                logger.debug("Fixing rule_type for room rule: %s -> text", rule_type)
+                rule_type = "text"
+            elif element_type == "door" and rule_type not in ["width_min", "text"]:
+                # Door rules should be width_min or text, not area_min
+                if rule_type == "area_min":
+                    logger.debug("Fixing rule_type for door rule: %s -> text", rule_type)
+                    rule_type = "text"
             
-            formatted.append(f"[Source: {source}, Page: {page}]\n{doc.page_content}")
-        return "\n\n---\n\n".join(formatted)
+            # Ensure all required fields are present
+            try:
+                rule = Rule(
+                    id=rule_data.get("id", f"EXTRACTED_{len(rules) + 1}"),
+                    name=rule_data.get("name", "Extracted rule"),
+                    rule_type=rule_type,
+                    element_type=element_type,
+                    min_value=rule_data.get("min_value"),
+                    code_ref=rule_data.get("code_ref"),
+                    rule_text=rule_data.get("rule_text")
+                )
+                rules.append(rule)
+            except Exception as e:
+                # Skip invalid rules
+                logger.warning("Skipping invalid rule: %s", e)
+                continue
+        return rules
+    else:
+        # Fallback: try to parse as single rule
+        rule_match = re.search(r'\{.*\}', answer, re.DOTALL)
+        if rule_match:
+            rule_data = orjson.loads(rule_match.group())
+            return [Rule(**rule_data)]
+        return []
+
+
+def _merge_extracted_rules(
+    extracted: List[Rule],
+    all_rules: List[Rule],
+    seen_rule_ids: set,
+    rule_counter: dict
+) -> None:
+    """Append extracted rules to all_rules, renaming IDs that clash."""
+    # Filter duplicates and assign unique IDs
+    for rule in extracted:
+        # Generate unique ID if it conflicts with existing or seeded rules
+        original_id = rule.id
+        if original_id in seen_rule_ids or original_id in SEEDED_RULE_IDS:
+            # Generate new ID based on element type
+            prefix = "R" if rule.element_type == "room" else "D"
+            new_id = f"{prefix}{rule_counter[prefix]:03d}"
+            rule_counter[prefix] += 1
+            rule.id = new_id
+            logger.debug("Renamed rule ID from %s to %s (conflict)", original_id, new_id)
+        
+        if rule.id not in seen_rule_ids:
+            all_rules.append(rule)
+            seen_rule_ids.add(rule.id)
+
+
+def merge_extracted_rules(per_pdf_rules: List[List[Rule]]) -> List[Rule]:
+    """
+    Merge per-PDF extraction results in order, renaming clashing IDs.
+    
+    Renamed rules are modified in place; pass copies of shared rules.
+    
+    Args:
+        per_pdf_rules: Extracted rules per PDF, in PDF order
+    
+    Returns:
+        Combined list of rules with unique IDs (R1xx/D1xx for renamed ones)
+    """
+    all_rules = []
+    seen_rule_ids = set()  # Avoid duplicates
+    rule_counter = {"R": 100, "D": 100}  # Start extracted IDs at 100 to avoid conflicts with seeded (R001-D002)
+    
+    for extracted in per_pdf_rules:
+        _merge_extracted_rules(extracted, all_rules, seen_rule_ids, rule_counter)
+    return all_rules
+
+
+# ============================================================================
+# Synchronous Extraction
+# ============================================================================
+
+def extract_rules_from_pdf(
+    pdf_path: str | Path,
+    vector_store: VectorStore,
+    project_context: ProjectContext,
+    max_rules: int = 20,
+    raise_on_error: bool = False
+) -> List[Rule]:
+    """
+    Extract structured rules from building code PDF using LLM.
     
-    # Extract rules (using a general query to find all rule-like sections)
-    query = "minimum area requirements room dimensions door width accessibility"
+    Process:
+    1. Load PDF and add to vector store (if not already added)
+    2. Use RAG to find relevant code sections
+    3. Use LLM with structured output to extract Rule objects
+    
+    Args:
+        pdf_path: Path to building code PDF
+        vector_store: VectorStore instance with PDF indexed
+        max_rules: Maximum number of rules to extract
+        raise_on_error: Re-raise extraction errors instead of returning [],
+                        so callers can tell a failure from "no rules found"
+    
+    Returns:
+        List of Rule objects extracted from PDF
+    """
+    # Load and index PDF if needed (shared stores may already have it)
+    _index_pdf(pdf_path, vector_store)
+    
+    # Get retriever (uses BM25-only by default, validated best), limited to
+    # this PDF's chunks: the shared store may hold other PDFs too
+    retriever = vector_store.get_retriever(k=10, source=Path(pdf_path).stem)
+    
+    # LLM with structured output
+    llm = get_llm(provider="openai", temperature=0.0)
     
     try:
-        # Retrieve documents
-        retrieved_docs = retriever.invoke(query)
-        
-        # Format context
+        # Retrieve documents and format context
+        retrieved_docs = retriever.invoke(EXTRACTION_QUERY)
         context = format_docs(retrieved_docs)
         
         # Invoke LLM with prompt
-        response = extraction_prompt.invoke({
+        prompt_value = EXTRACTION_PROMPT.invoke({
             "context": context,
-            "max_rules": max_rules,
-            "project_context": context_summary,
-            "building_type": project_context.building_type,
-            "number_of_stories": project_context.number_of_stories,
-            "occupancy": project_context.occupancy,
-            "building_classification": project_context.building_classification,
-            "exclusions": exclusion_text
+            **_build_prompt_inputs(project_context, max_rules)
         })
-        response = llm.invoke(response)
+        response = llm.invoke(prompt_value)
         answer = response.content if hasattr(response, 'content') else str(response)
         
-        # Parse JSON response manually (LLM returns JSON string)
-        import json
-        import re
-        
-        # Extract JSON array from response
-        json_match = re.search(r'\[.*\]', answer, re.DOTALL)
-        if json_match:
-            rules_data = json.loads(json_match.group())
-            rules = []
-            for rule_data in rules_data:
-                # Validate and filter element_type (must be "room" or "door")
-                element_type = rule_data.get("element_type", "room")
-                if element_type not in ["room", "door"]:
-                    # Skip invalid element types
-                    print(f"  Skipping rule with invalid element_type: {element_type}")
-                    continue
-                
-                # Validate rule_type matches element_type
-                rule_type = rule_data.get("rule_type", "text")
-                if element_type == "room" and rule_type not in ["area_min", "text"]:
-                    # Room rules should be area_min or text, not width_min
-                    print(f"  Fixing rule_type for room rule: {rule_type} -> text")
-                    rule_type = "text"
-                elif element_type == "door" and rule_type not in ["width_min", "text"]:
-                    # Door rules should be width_min or text, not area_min
-                    if rule_type == "area_min":
-                        print(f"  Fixing rule_type for door rule: {rule_type} -> text")
-                        rule_type = "text"
-                
-                # Ensure all required fields are present
-                try:
-                    rule = Rule(
-                        id=rule_data.get("id", f"EXTRACTED_{len(rules) + 1}"),
-                        name=rule_data.get("name", "Extracted rule"),
-                        rule_type=rule_type,
-                        element_type=element_type,
-                        min_value=rule_data.get("min_value"),
-                        code_ref=rule_data.get("code_ref"),
-                        rule_text=rule_data.get("rule_text")
-                    )
-                    rules.append(rule)
-                except Exception as e:
-                    # Skip invalid rules
-                    print(f"  Skipping invalid rule: {e}")
-                    continue
-            return rules
-        else:
-            # Fallback: try to parse as single rule
-            rule_match = re.search(r'\{.*\}', answer, re.DOTALL)
-            if rule_match:
-                rule_data = json.loads(rule_match.group())
-                return [Rule(**rule_data)]
-            return []
+        return _parse_rules(answer)
     except Exception as e:
         # Log error but don't fail - return empty list
-        print(f"Error extracting rules from {pdf_path}: {e}")
+        logger.error("Error extracting rules from %s: %s", pdf_path, e)
+        if raise_on_error:
+            raise
         return []
 
 
@@ -260,33 +360,42 @@ def extract_rules_from_pdfs(
     """
     Extract rules from multiple PDF files.
     
-    This is the main function to call from rules_seed.py.
+    rules_seed.py extracts (and caches) per PDF with extract_rules_from_pdf()
+    and merges with merge_extracted_rules(); this runs the whole set at once.
     
     Args:
         pdf_paths: List of paths to building code PDFs
-        vector_store: Optional VectorStore instance. If None, creates a new one.
+        vector_store: Optional VectorStore instance. If None, uses the shared default store.
         max_rules_per_pdf: Maximum rules to extract per PDF
     
     Returns:
         Combined list of all extracted rules from all PDFs
     """
-    from app.services.vector_store import VectorStore as VS
+    from app.services.vector_store import get_default_vector_store
     
-    # Use provided vector store or create new one
+    # Use provided vector store or the shared default one
     if vector_store is None:
-        vector_store = VS()
-    
-    all_rules = []
-    seen_rule_ids = set()  # Avoid duplicates
-    rule_counter = {"R": 100, "D": 100}  # Start extracted IDs at 100 to avoid conflicts with seeded (R001-D002)
+        vector_store = get_default_vector_store()
     
+    existing_paths = []
     for pdf_path in pdf_paths:
         pdf_path_obj = Path(pdf_path)
         if not pdf_path_obj.exists():
-            print(f"Warning: PDF not found: {pdf_path}")
+            logger.warning("PDF not found: %s", pdf_path)
             continue
-        
-        print(f"Extracting rules from {pdf_path_obj.name}...")
+        existing_paths.append(pdf_path_obj)
+    
+    # Index every PDF before extracting, so each PDF's retrieval sees the same
+    # BM25 corpus statistics as the async version
+    for pdf_path_obj in existing_paths:
+        _index_pdf(pdf_path_obj, vector_store)
+    
+    all_rules = []
+    seen_rule_ids = set()  # Avoid duplicates
+    rule_counter = {"R": 100, "D": 100}  # Start extracted IDs at 100 to avoid conflicts with seeded (R001-D002)
+    
+    for pdf_path_obj in existing_paths:
+        logger.debug("Extracting rules from %s...", pdf_path_obj.name)
         extracted = extract_rules_from_pdf(
             pdf_path_obj,
             vector_store,
@@ -295,22 +404,137 @@ def extract_rules_from_pdfs(
         )
         
         # Filter duplicates and assign unique IDs
-        for rule in extracted:
-            # Generate unique ID if it conflicts with existing or seeded rules
-            original_id = rule.id
-            if original_id in seen_rule_ids or original_id in ["R001", "R002", "D001", "D002"]:
-                # Generate new ID based on element type
-                prefix = "R" if rule.element_type == "room" else "D"
-                new_id = f"{prefix}{rule_counter[prefix]:03d}"
-                rule_counter[prefix] += 1
-                rule.id = new_id
-                print(f"  Renamed rule ID from {original_id} to {new_id} (conflict)")
+        _merge_extracted_rules(extracted, all_rules, seen_rule_ids, rule_counter)
+        
+        logger.debug("Extracted %d rules from %s", len(extracted), pdf_path_obj.name)
+    
+    logger.info("Total extracted rules: %d", len(all_rules))
+    return all_rules
+
+
+# ============================================================================
+# Asynchronous Extraction
+# ============================================================================
+
+async def extract_rules_from_pdf_async(
+    pdf_path: str | Path,
+    vector_store: VectorStore,
+    project_context: ProjectContext,
+    max_rules: int = 20,
+    semaphore: asyncio.Semaphore | None = None
+) -> List[Rule]:
+    """
+    Async version of extract_rules_from_pdf().
+    
+    Retrieval and the LLM call are awaited (``ainvoke``) so several
+    extractions can wait on the network concurrently.
+    
+    Args:
+        pdf_path: Path to building code PDF
+        vector_store: VectorStore instance with PDF indexed
+        project_context: Project context used to filter rules
+        max_rules: Maximum number of rules to extract
+        semaphore: Optional semaphore bounding concurrent LLM calls
+    
+    Returns:
+        List of Rule objects extracted from PDF
+    """
+    # Indexing is CPU-bound; run it off the event loop
+    await asyncio.to_thread(_index_pdf, pdf_path, vector_store)
+    
+    retriever = vector_store.get_retriever(k=10, source=Path(pdf_path).stem)
+    llm = get_llm(provider="openai", temperature=0.0)
+    
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    
+    try:
+        async with semaphore:
+            retrieved_docs = await retriever.ainvoke(EXTRACTION_QUERY)
+            context = format_docs(retrieved_docs)
             
-            if rule.id not in seen_rule_ids:
-                all_rules.append(rule)
-                seen_rule_ids.add(rule.id)
+            prompt_value = await EXTRACTION_PROMPT.ainvoke({
+                "context": context,
+                **_build_prompt_inputs(project_context, max_rules)
+            })
+            response = await llm.ainvoke(prompt_value)
+        answer = response.content if hasattr(response, 'content') else str(response)
+        
+        return _parse_rules(answer)
+    except Exception as e:
+        # Log error but don't fail - return empty list
+        logger.error("Error extracting rules from %s: %s", pdf_path, e)
+        return []
+
+
+async def extract_rules_from_pdfs_async(
+    pdf_paths: List[str | Path],
+    project_context: ProjectContext,
+    vector_store: VectorStore | None = None,
+    max_rules_per_pdf: int = 15,
+    max_concurrency: int = MAX_CONCURRENT_EXTRACTIONS
+) -> List[Rule]:
+    """
+    Async version of extract_rules_from_pdfs(): extracts from all PDFs concurrently.
+    
+    PDFs are indexed first (sequentially, so the shared store is never
+    mutated concurrently), then all LLM extractions run under one
+    semaphore. Each extraction retrieves only from its own PDF, and results
+    are merged in input order, so prompts and rule IDs match the sync
+    version (which also indexes every PDF before extracting).
+    
+    Args:
+        pdf_paths: List of paths to building code PDFs
+        project_context: Project context used to filter rules
+        vector_store: Optional VectorStore instance. If None, uses the shared default store.
+        max_rules_per_pdf: Maximum rules to extract per PDF
+        max_concurrency: Maximum concurrent LLM calls
+    
+    Returns:
+        Combined list of all extracted rules from all PDFs
+    """
+    from app.services.vector_store import get_default_vector_store
+    
+    if vector_store is None:
+        vector_store = get_default_vector_store()
+    
+    existing_paths = []
+    for pdf_path in pdf_paths:
+        pdf_path_obj = Path(pdf_path)
+        if not pdf_path_obj.exists():
+            logger.warning("PDF not found: %s", pdf_path)
+            continue
+        existing_paths.append(pdf_path_obj)
+    
+    for pdf_path_obj in existing_paths:
+        await asyncio.to_thread(_index_pdf, pdf_path_obj, vector_store)
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = await asyncio.gather(
+        *[
+            extract_rules_from_pdf_async(
+                pdf_path_obj,
+                vector_store,
+                project_context,
+                max_rules=max_rules_per_pdf,
+                semaphore=semaphore
+            )
+            for pdf_path_obj in existing_paths
+        ],
+        return_exceptions=True
+    )
+    
+    all_rules = []
+    seen_rule_ids = set()  # Avoid duplicates
+    rule_counter = {"R": 100, "D": 100}  # Start extracted IDs at 100 to avoid conflicts with seeded (R001-D002)
+    
+    for pdf_path_obj, extracted in zip(existing_paths, results):
+        if isinstance(extracted, BaseException):
+            logger.error("Error extracting rules from %s: %s", pdf_path_obj, extracted)
+            continue
         
-        print(f"  Extracted {len(extracted)} rules from {pdf_path_obj.name}")
+        _merge_extracted_rules(extracted, all_rules, seen_rule_ids, rule_counter)
+        logger.debug("Extracted %d rules from %s", len(extracted), pdf_path_obj.name)
     
-    print(f"Total extracted rules: {len(all_rules)}")
-    return all_rules
\ No newline at end of file
+    logger.info("Total extracted rules: %d", len(all_rules))
+    return all_rules
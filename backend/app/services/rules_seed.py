@@ -1,11 +1,71 @@
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import List
 
+import orjson
+
 from app.models.domain import Rule, ProjectContext
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # Seeded Building Code Rules
 # ============================================================================
 
+# Built once at import time: Rule construction runs Pydantic validation,
+# so the helpers below should not rebuild these on every lookup.
+_SEEDED_RULES: tuple[Rule, ...] = (
+    # ==============================================================
+    # Room Area Rules
+    # ==============================================================
+
+    Rule(
+        id="R001",
+        name="Minimum bedroom area",
+        rule_type="area_min",
+        element_type="room",
+        min_value=9.5, # m²
+        code_ref="NBC Section 8.2.1 - Minimum habitable room area"
+    ),
+
+    Rule(
+        id="R002",
+        name="Minimum living room area",
+        rule_type="area_min",
+        element_type="room",
+        min_value=12.0, # m²
+        code_ref="NBC Section 8.2.2 - Minimum living area"
+    ),
+
+    # ==============================================================
+    # Door Width Rules
+    # ==============================================================
+
+    Rule(
+        id="D001",
+        name="Minimum accessible door width",
+        rule_type="width_min",
+        element_type="door",
+        min_value=800.0, # mm (0.8 meters)
+        code_ref="NBC Section 8.3.2 - Accessible door clear width"            
+    ),
+
+    Rule(
+        id="D002",
+        name="Minimum standard door width",
+        rule_type="width_min",
+        element_type="door",
+        min_value=700.0, # mm (0.7 meters)
+        code_ref="NBC Section 8.3.1 - Standard door clear width"
+    ),
+)
+
+# Index for O(1) lookup of seeded rules by ID
+_SEEDED_BY_ID = {rule.id: rule for rule in _SEEDED_RULES}
+
+
 def get_seeded_rules() -> List[Rule]:
     """
     Return hardcoded building code rules for MVP.
@@ -17,51 +77,7 @@ def get_seeded_rules() -> List[Rule]:
     - Use `get_all_rules()` to combine seeded + extracted rules
     - LLM extraction is the MVP core feature (rule_extractor.py)
     """
-    return [
-        # ==============================================================
-        # Room Area Rules
-        # ==============================================================
-
-        Rule(
-            id="R001",
-            name="Minimum bedroom area",
-            rule_type="area_min",
-            element_type="room",
-            min_value=9.5, # m²
-            code_ref="NBC Section 8.2.1 - Minimum habitable room area"
-        ),
-
-        Rule(
-            id="R002",
-            name="Minimum living room area",
-            rule_type="area_min",
-            element_type="room",
-            min_value=12.0, # m²
-            code_ref="NBC Section 8.2.2 - Minimum living area"
-        ),
-
-        # ==============================================================
-        # Door Width Rules
-        # ==============================================================
-
-        Rule(
-            id="D001",
-            name="Minimum accessible door width",
-            rule_type="width_min",
-            element_type="door",
-            min_value=800.0, # mm (0.8 meters)
-            code_ref="NBC Section 8.3.2 - Accessible door clear width"            
-        ),
-
-        Rule(
-            id="D002",
-            name="Minimum standard door width",
-            rule_type="width_min",
-            element_type="door",
-            min_value=700.0, # mm (0.7 meters)
-            code_ref="NBC Section 8.3.1 - Standard door clear width"
-        ),
-    ]
+    return list(_SEEDED_RULES)
 
 def get_default_project_context() -> ProjectContext:
     """
@@ -82,6 +98,112 @@ def get_default_project_context() -> ProjectContext:
     )
 
 
+# ============================================================================
+# Extracted Rules Cache
+# ============================================================================
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+RULES_CACHE_DIR = Path("./cache/rules")
+MAX_RULES_PER_PDF = 15
+
+# Bump when the extraction prompt/parsing changes, to invalidate cached rules
+RULES_CACHE_VERSION = 2
+
+
+def _pdf_cache_key(pdf_path: Path) -> tuple:
+    """
+    In-process cache key for one PDF: (path, mtime, size).
+
+    Cheap to compute on every call (no file reads), and changes whenever the
+    PDF is modified, following the design_loader pattern.
+    """
+    stat = pdf_path.stat()
+    return (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _rules_cache_path(pdf_path: Path, context_json: str) -> Path:
+    """On-disk cache file for one PDF's extracted rules: content hash + context + version."""
+    from app.services.pdf_ingest import file_sha256
+
+    key = "|".join(
+        [file_sha256(pdf_path), context_json, str(MAX_RULES_PER_PDF), f"v{RULES_CACHE_VERSION}"]
+    )
+    return RULES_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+@lru_cache(maxsize=32)
+def _get_pdf_rules(pdf_key: tuple, context_json: str) -> tuple[Rule, ...]:
+    """
+    LLM-extracted rules for one PDF, memoized in-process and on disk.
+
+    Extraction output is deterministic for a fixed PDF + prompt + context, so
+    it is cached twice: lru_cache for repeat calls in this process (every
+    rule lookup helper goes through get_all_rules()), and a JSON file keyed by
+    PDF content hash so later runs skip the LLM pass entirely.
+
+    Extraction runs with raise_on_error=True, so a failure raises instead of
+    returning []. Exceptions are not cached (by lru_cache or on disk), so only
+    the PDF that failed is retried on the next call. Empty results are not
+    written to disk either.
+
+    The cached Rule objects are shared by every call; get_all_rules() merges
+    copies of them.
+
+    Args:
+        pdf_key: Output of _pdf_cache_key() (path, mtime, size)
+        context_json: ProjectContext serialized with model_dump_json()
+
+    Returns:
+        Tuple of the PDF's extracted rules, with IDs as returned by the LLM
+    """
+    from app.services.rule_extractor import extract_rules_from_pdf
+    from app.services.vector_store import get_default_vector_store
+
+    pdf_path = Path(pdf_key[0])
+    cache_path = _rules_cache_path(pdf_path, context_json)
+    if cache_path.exists():
+        try:
+            cached = tuple(
+                Rule.model_validate(rule) for rule in orjson.loads(cache_path.read_bytes())
+            )
+            logger.info("Loaded %d extracted rules for %s from cache", len(cached), pdf_path.name)
+            return cached
+        except Exception as e:
+            logger.warning("Ignoring unreadable rules cache %s: %s", cache_path.name, e)
+
+    project_context = ProjectContext.model_validate_json(context_json)
+    logger.info(
+        "Extracting rules from %s with project context: %s %s %s %s",
+        pdf_path.name,
+        project_context.building_type,
+        project_context.number_of_stories,
+        project_context.occupancy,
+        project_context.building_classification
+    )
+
+    # Use singleton vector store pattern (shared with chat endpoint)
+    extracted = tuple(extract_rules_from_pdf(
+        pdf_path,
+        get_default_vector_store(),
+        project_context,
+        max_rules=MAX_RULES_PER_PDF,
+        raise_on_error=True
+    ))
+    logger.info("Extracted %d rules from %s", len(extracted), pdf_path.name)
+
+    if extracted:
+        RULES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps([rule.model_dump(mode="json") for rule in extracted]))
+        tmp_path.replace(cache_path)
+    return extracted
+
+
+def clear_rules_cache() -> None:
+    """Clear the in-process extracted rules cache (the on-disk cache is kept)."""
+    _get_pdf_rules.cache_clear()
+
+
 def get_all_rules(project_context: ProjectContext | None = None) -> List[Rule]:
     """
     Combine seeded rules with LLM-extracted rules from PDFs.
@@ -94,18 +216,24 @@ def get_all_rules(project_context: ProjectContext | None = None) -> List[Rule]:
     **LLM Integration:**
     Extracts rules from PDFs in app/data/ directory.
     Uses project context to filter rules to only those applicable.
-    Falls back to seeded rules only if extraction fails.
+    A PDF whose extraction fails is skipped (and retried on the next call);
+    the other PDFs' rules are still returned.
+
+    **Caching:**
+    Extracted rules are memoized per (PDF file, project context): in-process
+    via lru_cache and across runs via ./cache/rules (keyed by PDF content
+    hash). Only the first successful call per PDF pays for the LLM extraction.
 
     Args:
         project_context: Project context for filtering rules. If None, uses default
                          (single-floor residential detached house).
 
     Returns:
-        Combined list of all rules (seeded + extracted)
+        Combined list of all rules (seeded + extracted). Extracted rules are
+        fresh copies, so callers may modify them without touching the cache.
     """
-    from pathlib import Path
-    from app.services.rule_extractor import extract_rules_from_pdfs
-    
+    from app.services.rule_extractor import merge_extracted_rules
+
     # Use default context if not provided
     if project_context is None:
         project_context = get_default_project_context()
@@ -113,39 +241,28 @@ def get_all_rules(project_context: ProjectContext | None = None) -> List[Rule]:
     seeded = get_seeded_rules()
     
     # Find PDFs in app/data/ directory
-    data_dir = Path(__file__).parent.parent / "data"
-    pdf_paths = list(data_dir.glob("*.pdf"))
+    pdf_paths = sorted(DATA_DIR.glob("*.pdf"))
     
     if not pdf_paths:
         print("No PDFs found in app/data/, using seeded rules only")
         return seeded
     
-    try:
-        # Extract rules from PDFs
-        # Use singleton vector store pattern (shared with chat endpoint)
-        from app.services.vector_store import VectorStore
-        vector_store = VectorStore()
-        
-        print(f"Extracting rules with project context: {project_context.building_type} {project_context.number_of_stories} {project_context.occupancy} {project_context.building_classification}")
-        
-        extracted = extract_rules_from_pdfs(
-            pdf_paths,
-            project_context=project_context,
-            vector_store=vector_store,
-            max_rules_per_pdf=15
-        )
-        
-        # Combine seeded + extracted
-        all_rules = seeded + extracted
-        
-        print(f"Total rules: {len(seeded)} seeded + {len(extracted)} extracted = {len(all_rules)} total")
-        return all_rules
-        
-    except Exception as e:
-        # Fallback to seeded rules if extraction fails
-        print(f"Error extracting rules from PDFs: {e}")
-        print("Falling back to seeded rules only")
-        return seeded
+    context_json = project_context.model_dump_json()
+    per_pdf_rules = []
+    for pdf_path in pdf_paths:
+        try:
+            per_pdf_rules.append(_get_pdf_rules(_pdf_cache_key(pdf_path), context_json))
+        except Exception as e:
+            # Keep the other PDFs' rules; this one is retried on the next call
+            logger.warning("Skipping rules from %s after extraction error: %s", pdf_path.name, e)
+    
+    # Merge copies in PDF order (renaming clashing IDs mutates the rules)
+    extracted = merge_extracted_rules(
+        [[rule.model_copy() for rule in rules] for rules in per_pdf_rules]
+    )
+    
+    # Combine seeded + extracted
+    return seeded + extracted
 
 # ==============================================================
 # Rule Filtering Helpers
@@ -205,6 +322,10 @@ def get_rule_by_id(rule_id: str) -> Rule | None:
         rule = get_rule_by_id("R001")
         # Returns Rule(id="R001", name="Minimum bedroom area", ...)
     """
+    # Seeded rules come first in get_all_rules(), so they win on ID clashes
+    if rule_id in _SEEDED_BY_ID:
+        return _SEEDED_BY_ID[rule_id]
+    
     all_rules = get_all_rules()  # Changed from get_seeded_rules()
     for rule in all_rules:
         if rule.id == rule_id:
@@ -11,62 +11,418 @@ Adapted from:
 - day_13: Hybrid retrieval pattern (BM25 + Dense via EnsembleRetriever)
 - day_5: BM25 retrieval evaluation patterns
 """
+import asyncio
 import hashlib
 import os
-from pathlib import Path
-from typing import List, Optional
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Set
+
+import bm25s
+import httpx
+import numpy as np
+import Stemmer
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import get_executor_for_config, patch_config
 from langchain.embeddings import CacheBackedEmbeddings as LangChainCacheBackedEmbeddings
-from langchain.storage import LocalFileStore
+from langchain_community.embeddings.infinity import InfinityEmbeddings
 from langchain_openai.embeddings import OpenAIEmbeddings
 from langchain_qdrant import QdrantVectorStore
+from pydantic import SkipValidation
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    HnswConfigDiff,
+    MatchValue,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
 
 # Hybrid retrieval imports
-from langchain_community.retrievers import BM25Retriever
 from langchain.retrievers import EnsembleRetriever
 
+from app.services.embedding_store import Float16ByteStore, SQLiteByteStore
+
+
+# BM25 token pattern: alphanumeric runs, keeping single characters so section
+# citations like "section 3" or "A-1" stay searchable
+_TOKEN_PATTERN = r"[A-Za-z0-9]+"
+
+# Per-thread Snowball English stemmers (PyStemmer objects aren't thread-safe,
+# and hybrid/chat retrieval tokenizes queries from worker threads)
+_stemmers = threading.local()
+
+
+def _get_stemmer() -> Stemmer.Stemmer:
+    """Get this thread's English stemmer, creating it on first use."""
+    stemmer = getattr(_stemmers, "stemmer", None)
+    if stemmer is None:
+        stemmer = _stemmers.stemmer = Stemmer.Stemmer("english")
+    return stemmer
+
+
+def _bm25s_tokenize(texts: List[str]) -> List[List[str]]:
+    """
+    Tokenize texts for the BM25S index (lowercase, Snowball stemming).
+    
+    Stop-words are kept: removing them barely helps ranking but breaks short
+    legal phrases, while stemming collapses "occupant"/"occupants"/"occupancy".
+    Corpus and queries must go through this same function.
+    """
+    return bm25s.tokenize(
+        texts,
+        token_pattern=_TOKEN_PATTERN,
+        stopwords=None,
+        stemmer=_get_stemmer(),
+        return_ids=False,
+        show_progress=False
+    )
+
+
+class BM25SRetriever(BaseRetriever):
+    """
+    BM25 retriever backed by a prebuilt BM25S index.
+    
+    BM25S scores eagerly at index time into sparse matrices, so queries avoid
+    rank_bm25's pure-Python scoring loop over every document, and returns the
+    top k via partial selection (np.argpartition, O(N + k log k)) rather than
+    sorting every score. The index is
+    cached on VectorStore and only rebuilt after add_documents(), not per
+    get_retriever() call.
+    """
+    
+    index: Any
+    """Prebuilt bm25s.BM25 index over ``docs``."""
+    docs: SkipValidation[List[Document]]
+    """Indexed documents (same order as the index; shared, not copied)."""
+    k: int = 4
+    """Number of documents to return."""
+    weight_mask: SkipValidation[Optional[np.ndarray]] = None
+    """Optional 0/1 mask over ``docs``; only documents with weight 1 are returned."""
+    
+    model_config = {"arbitrary_types_allowed": True}
+    
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        candidates = len(self.docs) if self.weight_mask is None else int(self.weight_mask.sum())
+        k = min(self.k, candidates)
+        if k == 0:
+            return []
+        
+        query_tokens = _bm25s_tokenize([query])
+        indices, _scores = self.index.retrieve(
+            query_tokens, k=k, show_progress=False, weight_mask=self.weight_mask
+        )
+        if self.weight_mask is None:
+            return [self.docs[i] for i in indices[0]]
+        # Masked-out documents score 0 and can still tie into the top k
+        return [self.docs[i] for i in indices[0] if self.weight_mask[i]]
+
+
+class QdrantIdRetriever(BaseRetriever):
+    """
+    Dense retriever that fetches only point IDs from Qdrant.
+    
+    QdrantVectorStore.as_retriever() pulls the full page_content payload of
+    every match, although hybrid fusion discards most of the fetch_k
+    candidates. This queries with with_payload=False and hydrates documents
+    from VectorStore's local id -> Document map (the same objects BM25
+    returns, so RRF still merges them by content). IDs missing locally
+    (e.g. a persistent collection indexed by an earlier process) are fetched
+    in one client.retrieve() call.
+    """
+    
+    vectorstore: Any
+    """QdrantVectorStore to query (its client, collection and embeddings)."""
+    docs_by_id: SkipValidation[Dict[str, Document]]
+    """Locally held documents keyed by Qdrant point ID (shared, not copied)."""
+    k: int = 4
+    """Number of documents to return."""
+    search_params: Any = None
+    """Optional Qdrant SearchParams (e.g. hnsw_ef)."""
+    query_filter: Any = None
+    """Optional Qdrant Filter applied to the search (e.g. one source PDF)."""
+    
+    model_config = {"arbitrary_types_allowed": True}
+    
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        store = self.vectorstore
+        response = store.client.query_points(
+            collection_name=store.collection_name,
+            query=store.embeddings.embed_query(query),
+            limit=self.k,
+            search_params=self.search_params,
+            query_filter=self.query_filter,
+            with_payload=False,
+            with_vectors=False
+        )
+        ids = [str(point.id) for point in response.points]
+        
+        docs = {point_id: self.docs_by_id[point_id] for point_id in ids if point_id in self.docs_by_id}
+        missing = [point_id for point_id in ids if point_id not in docs]
+        if missing:
+            for record in store.client.retrieve(store.collection_name, ids=missing, with_payload=True):
+                docs[str(record.id)] = Document(
+                    page_content=record.payload[store.content_payload_key],
+                    metadata=record.payload.get(store.metadata_payload_key) or {}
+                )
+        
+        return [docs[point_id] for point_id in ids if point_id in docs]
+
+
+class ConcurrentEnsembleRetriever(EnsembleRetriever):
+    """
+    EnsembleRetriever that queries its retrievers concurrently on the sync path.
+    
+    LangChain's EnsembleRetriever.invoke() calls each retriever in turn, so
+    hybrid latency is BM25 time + dense time (OpenAI embed + Qdrant round trip).
+    The retrievers are independent, so they run in a thread pool here and
+    latency becomes the slower of the two. ainvoke() already gathers them
+    concurrently upstream; fusion (weighted RRF, c=60) is unchanged.
+    
+    If ``k`` is set, the fused list is truncated to the top ``k`` documents, so
+    sub-retrievers can fetch a wider candidate pool than is returned.
+    """
+    
+    k: Optional[int] = None
+    """Number of fused documents to return (None returns all)."""
+    
+    def rank_fusion(
+        self,
+        query: str,
+        run_manager: CallbackManagerForRetrieverRun,
+        *,
+        config: Optional[RunnableConfig] = None,
+    ) -> List[Document]:
+        def _retrieve(i: int, retriever: BaseRetriever) -> List[Document]:
+            return retriever.invoke(
+                query,
+                patch_config(config, callbacks=run_manager.get_child(tag=f"retriever_{i + 1}")),
+            )
+        
+        with get_executor_for_config(config) as executor:
+            retriever_docs = list(
+                executor.map(_retrieve, range(len(self.retrievers)), self.retrievers)
+            )
+        
+        return self.weighted_reciprocal_rank(retriever_docs)[:self.k]
+    
+    async def arank_fusion(
+        self,
+        query: str,
+        run_manager: AsyncCallbackManagerForRetrieverRun,
+        *,
+        config: Optional[RunnableConfig] = None,
+    ) -> List[Document]:
+        fused = await super().arank_fusion(query, run_manager, config=config)
+        return fused[:self.k]
+
+
+EmbeddingBackend = Literal["openai", "infinity"]
+
+# Default embedding model per backend
+DEFAULT_EMBEDDING_MODELS: Dict[str, str] = {
+    "openai": "text-embedding-3-small",
+    "infinity": "BAAI/bge-small-en-v1.5",
+}
+
+# Vector size per embedding model (must match the Qdrant collection)
+EMBEDDING_DIMENSIONS: Dict[str, int] = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
+}
+
+# HNSW beam width for dense queries; lower than Qdrant's default (ef = 100)
+# since hybrid fusion re-ranks a wider candidate pool anyway. On quantized
+# (persistent) collections, search the INT8 copies for 2x the candidates and
+# rescore them with the original vectors; in-memory collections ignore both.
+DENSE_SEARCH_PARAMS = SearchParams(
+    hnsw_ef=64,
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Upper bound on in-flight OpenAI embedding requests (rate-limit friendly)
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 16
+
+# Texts per ingestion batch when pre-embedding in VectorStore.add_documents()
+INGEST_BATCH_SIZE = 256
+
+
+class ConcurrentOpenAIEmbeddings(OpenAIEmbeddings):
+    """
+    OpenAIEmbeddings that sends its sub-batches concurrently.
+    
+    The stock implementation awaits one ``chunk_size`` sub-batch after another,
+    so ingesting N texts costs N / chunk_size serial HTTP round trips. Here the
+    sub-batches are built up front and dispatched together (bounded by
+    MAX_CONCURRENT_EMBEDDING_REQUESTS); results are flattened in input order.
+    """
+    
+    def _sub_batches(self, texts: List[str], chunk_size: Optional[int]) -> List[List[str]]:
+        size = chunk_size or self.chunk_size
+        return [texts[i:i + size] for i in range(0, len(texts), size)]
+    
+    def embed_documents(
+        self, texts: List[str], chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> List[List[float]]:
+        batches = self._sub_batches(texts, chunk_size)
+        if len(batches) <= 1:
+            return super().embed_documents(texts, chunk_size=chunk_size, **kwargs)
+        
+        def _embed(batch: List[str]) -> List[List[float]]:
+            return super(ConcurrentOpenAIEmbeddings, self).embed_documents(batch, **kwargs)
+        
+        workers = min(len(batches), MAX_CONCURRENT_EMBEDDING_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_embed, batches))
+        return [embedding for batch in results for embedding in batch]
+    
+    async def aembed_documents(
+        self, texts: List[str], chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> List[List[float]]:
+        batches = self._sub_batches(texts, chunk_size)
+        if len(batches) <= 1:
+            return await super().aembed_documents(texts, chunk_size=chunk_size, **kwargs)
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_REQUESTS)
+        
+        async def _embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await super(ConcurrentOpenAIEmbeddings, self).aembed_documents(batch, **kwargs)
+        
+        results = await asyncio.gather(*(_embed(batch) for batch in batches))
+        return [embedding for batch in results for embedding in batch]
+
+
+class NormalizingEmbeddings(Embeddings):
+    """
+    Embeddings adapter that L2-normalizes every vector.
+    
+    With unit-length vectors, dot product ranks exactly like cosine, so the
+    Qdrant collection can use Distance.DOT and skip per-comparison norms.
+    OpenAI embeddings are already ~unit-norm; this guarantees it for any model.
+    """
+    
+    def __init__(self, base: Embeddings):
+        """
+        Args:
+            base: Embeddings to wrap (e.g. the cache-backed embeddings)
+        """
+        self.base = base
+    
+    @staticmethod
+    def _normalize(vectors: List[List[float]]) -> List[List[float]]:
+        if not vectors:
+            return []
+        array = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(array, axis=1, keepdims=True)
+        array /= np.where(norms == 0, 1.0, norms)  # leave zero vectors as-is
+        return array.tolist()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._normalize(self.base.embed_documents(texts))
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self._normalize([self.base.embed_query(text)])[0]
+    
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._normalize(await self.base.aembed_documents(texts))
+    
+    async def aembed_query(self, text: str) -> List[float]:
+        return self._normalize([await self.base.aembed_query(text)])[0]
+
 
 class CacheBackedEmbeddings:
     """
-    Production cache-backed embeddings using OpenAI.
+    Production cache-backed embeddings using OpenAI or a local Infinity server.
     
     Pattern from day_12-Caching-Guardrails_and_Reasoning/langgraph_agent_lib/caching.py
     """
     
     def __init__(
         self, 
-        model: str = "text-embedding-3-small",
+        model: Optional[str] = None,
         cache_dir: str = "./cache/embeddings",
-        batch_size: int = 32
+        batch_size: int = 1024,
+        chunk_size: int = 256,
+        embedding_backend: EmbeddingBackend = "openai",
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize cache-backed embeddings.
         
         Args:
-            model: OpenAI embedding model name
+            model: Embedding model name (defaults per backend, see DEFAULT_EMBEDDING_MODELS)
             cache_dir: Directory to store embedding cache
-            batch_size: Batch size for embedding calls
+            batch_size: Number of uncached texts embedded per cache write
+            chunk_size: Texts per OpenAI request; a batch is split into
+                        chunk_size requests sent concurrently
+            embedding_backend: "openai" (default) or "infinity" for a local
+                               Infinity server at INFINITY_API_URL
+            http_client: Optional shared sync httpx client for OpenAI requests
+                         (see app.core.http_clients); ignored for Infinity
+            http_async_client: Optional shared async httpx client for OpenAI requests
         """
+        model = model or DEFAULT_EMBEDDING_MODELS[embedding_backend]
         self.model = model
         self.cache_dir = cache_dir
         self.batch_size = batch_size
+        self.embedding_backend = embedding_backend
         
         # Create base embeddings
-        self.base_embeddings = OpenAIEmbeddings(model=model)
+        if embedding_backend == "infinity":
+            # Local server: no network RTT or rate limits, batches server-side
+            self.base_embeddings = InfinityEmbeddings(
+                model=model,
+                infinity_api_url=os.getenv("INFINITY_API_URL", "http://localhost:7997")
+            )
+        else:
+            # OpenAI: sub-batches dispatched concurrently
+            self.base_embeddings = ConcurrentOpenAIEmbeddings(
+                model=model,
+                chunk_size=chunk_size,
+                http_client=http_client,
+                http_async_client=http_async_client
+            )
         
         # Create safe namespace from model name
-        safe_namespace = hashlib.md5(model.encode()).hexdigest()
+        safe_namespace = hashlib.blake2b(model.encode(), digest_size=16).hexdigest()
         
-        # Set up file store and cached embeddings
+        # Set up SQLite store (one file, indexed lookups) holding float16
+        # vectors, and cached embeddings
         os.makedirs(cache_dir, exist_ok=True)
-        store = LocalFileStore(cache_dir)
+        store = Float16ByteStore(SQLiteByteStore(os.path.join(cache_dir, "embeddings.db")))
         self.cached_embeddings = LangChainCacheBackedEmbeddings.from_bytes_store(
             self.base_embeddings, 
             store, 
             namespace=safe_namespace,
-            batch_size=batch_size
+            batch_size=batch_size,
+            # Cache embed_query() too (same store): repeated chat/eval questions
+            # skip the OpenAI round trip
+            query_embedding_cache=True,
+            key_encoder="blake2b"  # also for per-text keys (default is SHA-1)
         )
     
     def get_embeddings(self):
@@ -100,27 +456,60 @@ class VectorStore:
     def __init__(
         self,
         collection_name: str = "building_codes",
-        embedding_model: str = "text-embedding-3-small",
+        embedding_model: Optional[str] = None,
         cache_dir: str = "./cache/embeddings",
-        use_memory: bool = True  # Use in-memory Qdrant for MVP
+        use_memory: bool = True,  # Use in-memory Qdrant for MVP
+        embedding_backend: EmbeddingBackend = "openai",
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+        client: Optional[QdrantClient] = None,
+        embedding_dimensions: Optional[int] = None
     ):
         """
         Initialize vector store with caching.
         
         Args:
             collection_name: Qdrant collection name
-            embedding_model: OpenAI embedding model name
+            embedding_model: Embedding model name (defaults per backend)
             cache_dir: Directory for embedding cache
             use_memory: If True, use in-memory Qdrant (MVP). If False, use persistent storage.
+            embedding_backend: "openai" (default) or "infinity" (local server)
+            http_client: Optional shared sync httpx client for embedding requests
+                         (pooled connections, see app.core.http_clients)
+            http_async_client: Optional shared async httpx client for embedding requests
+            client: Optional shared QdrantClient (e.g. one in-memory instance for
+                    several collections). Defaults to a new client per VectorStore;
+                    with a shared in-memory client, collection_name must be unique.
+            embedding_dimensions: Vector size of the embedding model. Defaults to
+                                  EMBEDDING_DIMENSIONS for known models; other
+                                  models are probed by embedding one string.
         """
         self.collection_name = collection_name
-        self.embedding_model = embedding_model
+        self.embedding_backend = embedding_backend
+        self.embedding_model = embedding_model or DEFAULT_EMBEDDING_MODELS[embedding_backend]
         self.cache_dir = cache_dir
         self.use_memory = use_memory
+        self.http_client = http_client
+        self.http_async_client = http_async_client
+        self.client = client
+        self.embedding_dimensions = embedding_dimensions
         
         # Store documents for BM25 retrieval (needs raw text, not just embeddings)
         self.documents: List[Document] = []
         
+        # Same documents keyed by Qdrant point ID (hydrates ID-only dense hits)
+        self._docs_by_id: Dict[str, Document] = {}
+        
+        # BM25 tokens for self.documents (same order), tokenized once at ingestion
+        self._tokens: List[List[str]] = []
+        
+        # Cached BM25S index over self.documents; rebuilt lazily once dirty
+        self._bm25: Optional[bm25s.BM25] = None
+        self._bm25_dirty = True
+        
+        # Resolved paths of PDFs already indexed (avoids re-adding the same chunks)
+        self.indexed_sources: Set[str] = set()
+        
         # Setup caching (day_12 pattern)
         self._setup_embeddings()
         
@@ -131,39 +520,114 @@ class VectorStore:
         """Setup cache-backed embeddings (day_12 lesson pattern)."""
         self.cached_embeddings_wrapper = CacheBackedEmbeddings(
             model=self.embedding_model,
-            cache_dir=self.cache_dir
+            cache_dir=self.cache_dir,
+            embedding_backend=self.embedding_backend,
+            http_client=self.http_client,
+            http_async_client=self.http_async_client
         )
-        self.embeddings = self.cached_embeddings_wrapper.get_embeddings()
+        # Unit-length vectors so the collection can use dot-product distance
+        self.embeddings = NormalizingEmbeddings(self.cached_embeddings_wrapper.get_embeddings())
+    
+    def _resolve_embedding_dimensions(self) -> int:
+        """
+        Vector size for the collection: explicit argument, known model, or a probe.
+        
+        Raises:
+            ValueError: If the model is not in EMBEDDING_DIMENSIONS and
+                        embedding a probe string fails
+        """
+        if self.embedding_dimensions is not None:
+            return self.embedding_dimensions
+        if self.embedding_model in EMBEDDING_DIMENSIONS:
+            return EMBEDDING_DIMENSIONS[self.embedding_model]
+        
+        try:
+            size = len(self.embeddings.embed_query("dimension probe"))
+        except Exception as e:
+            raise ValueError(
+                f"Unknown vector size for embedding model '{self.embedding_model}' "
+                f"and probing it failed ({e}). Pass embedding_dimensions explicitly."
+            ) from e
+        self.embedding_dimensions = size
+        return size
     
     def _setup_vectorstore(self):
         """Setup Qdrant vector store (day_9_A2A pattern)."""
-        if self.use_memory:
-            # In-memory Qdrant for MVP
-            client = QdrantClient(":memory:")
-        else:
-            # Persistent storage (future)
-            client = QdrantClient(path="./qdrant_db")
+        size = self._resolve_embedding_dimensions()
         
-        # Create collection if needed
-        try:
+        if self.use_memory:
+            # In-memory Qdrant for MVP: a fresh (or shared) client, where the
+            # collection must not exist yet (create_collection raises otherwise).
+            # Minimal config (HNSW/quantization are ignored here).
+            client = self.client or QdrantClient(":memory:")
             client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
-                    size=1536,  # OpenAI text-embedding-3-small size
-                    distance=Distance.COSINE
+                    size=size,
+                    distance=Distance.DOT  # same ranking as COSINE on normalized vectors
                 )
             )
-        except Exception:
-            # Collection already exists
-            pass
+            distance = Distance.DOT
+        else:
+            # Persistent storage
+            client = self.client or QdrantClient(path="./qdrant_db")
+            distance = self._ensure_persistent_collection(client, size)
         
         # Create vector store
         self.vectorstore = QdrantVectorStore(
             client=client,
             collection_name=self.collection_name,
-            embedding=self.embeddings
+            embedding=self.embeddings,
+            distance=distance
         )
     
+    def _ensure_persistent_collection(self, client: QdrantClient, size: int) -> Distance:
+        """
+        Create the persistent collection if missing, or validate the existing one.
+        
+        Args:
+            client: Qdrant client backed by persistent storage
+            size: Expected vector size for the configured embedding model
+        
+        Returns:
+            The collection's distance (collections created before the switch
+            to DOT are still COSINE; ranking is identical on normalized vectors)
+        
+        Raises:
+            ValueError: If an existing collection's vector size doesn't match
+                        the embedding model
+        """
+        if client.collection_exists(self.collection_name):
+            vectors = client.get_collection(self.collection_name).config.params.vectors
+            if vectors.size != size:
+                raise ValueError(
+                    f"Qdrant collection '{self.collection_name}' has vector size "
+                    f"{vectors.size}, but embedding model '{self.embedding_model}' "
+                    f"produces {size}. Use another collection_name or delete ./qdrant_db."
+                )
+            return vectors.distance
+        
+        # Keep original vectors, HNSW graph and payloads on disk and search
+        # INT8-quantized copies in RAM (~4x smaller, rescored with the originals)
+        client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=VectorParams(
+                size=size,
+                distance=Distance.DOT,
+                on_disk=True
+            ),
+            hnsw_config=HnswConfigDiff(m=16, ef_construct=128, on_disk=True),
+            on_disk_payload=True,
+            quantization_config=ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True
+                )
+            )
+        )
+        return Distance.DOT
+    
     def add_documents(self, documents: List[Document]):
         """
         Add documents to vector store and store for BM25 retrieval.
@@ -171,19 +635,95 @@ class VectorStore:
         Args:
             documents: List of Document objects (chunked PDFs)
         """
-        # Store documents for BM25 (needs raw text)
-        self.documents.extend(documents)
+        if not documents:
+            return
+        
+        # Embed concurrently first so the (sequential) Qdrant upsert below
+        # only reads vectors back from the embedding cache
+        self._embed_concurrently([doc.page_content for doc in documents])
         
         # Add to vector store for dense embeddings
-        self.vectorstore.add_documents(documents)
+        ids = [uuid.uuid4().hex for _ in documents]
+        self.vectorstore.add_documents(
+            documents, ids=ids, batch_size=self.cached_embeddings_wrapper.batch_size
+        )
+        
+        # Store documents for BM25 (needs raw text) only once the dense upsert
+        # succeeded, so a failed batch can't leave BM25 ahead of Qdrant
+        self.documents.extend(documents)
+        self._tokens.extend(_bm25s_tokenize([doc.page_content for doc in documents]))
+        self._docs_by_id.update(zip(ids, documents))
+        self._bm25_dirty = True
+    
+    def _embed_concurrently(self, texts: List[str]):
+        """
+        Embed texts in concurrent batches, populating the embedding cache.
+        
+        Texts are sorted longest-first before batching so each request packs
+        similar-length texts (tighter per-request token counts). Qdrant upserts
+        stay sequential; only the network-bound embedding calls run in parallel.
+        
+        Args:
+            texts: Texts to embed (already-cached texts are skipped by the cache)
+        """
+        cached_embeddings = self.cached_embeddings_wrapper.get_embeddings()
+        by_length = sorted(texts, key=len, reverse=True)
+        batches = [
+            by_length[i:i + INGEST_BATCH_SIZE]
+            for i in range(0, len(by_length), INGEST_BATCH_SIZE)
+        ]
+        
+        workers = min(len(batches), MAX_CONCURRENT_EMBEDDING_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(cached_embeddings.embed_documents, batches))
+    
+    def _setup_bm25(self):
+        """Build the BM25S index from the pre-tokenized corpus (no re-tokenizing)."""
+        self._bm25 = bm25s.BM25(k1=1.5, b=0.75)
+        self._bm25.index(self._tokens, show_progress=False)
+        self._bm25_dirty = False
+    
+    def _get_bm25_retriever(self, k: int, source: Optional[str] = None) -> BM25SRetriever:
+        """
+        Wrap the cached BM25S index in a retriever returning k documents.
+        
+        The index is only rebuilt when add_documents() has changed the corpus,
+        so repeated get_retriever() calls (one per chat turn) reuse it. A new
+        lightweight wrapper is returned per call rather than mutating a shared
+        retriever's k, since the default store is shared across callers.
+        With a source, the shared index is masked to that PDF's chunks.
+        """
+        if self._bm25_dirty or self._bm25 is None:
+            self._setup_bm25()
+        weight_mask = None
+        if source is not None:
+            weight_mask = np.fromiter(
+                (doc.metadata.get("source") == source for doc in self.documents),
+                dtype=np.float32,
+                count=len(self.documents)
+            )
+        return BM25SRetriever(index=self._bm25, docs=self.documents, k=k, weight_mask=weight_mask)
+    
+    def _source_filter(self, source: Optional[str]) -> Optional[Filter]:
+        """Qdrant payload filter matching chunks of one source PDF (None for all)."""
+        if source is None:
+            return None
+        return Filter(must=[
+            FieldCondition(
+                key=f"{self.vectorstore.metadata_payload_key}.source",
+                match=MatchValue(value=source)
+            )
+        ])
     
     def get_retriever(
         self, 
         k: int = 5, 
         use_hybrid: bool = False,
         use_bm25_only: bool = True,
-        bm25_weight: float = 0.5,
-        dense_weight: float = 0.5
+        bm25_weight: float = 0.1,
+        dense_weight: float = 0.9,
+        fetch_k: int = 20,
+        source: Optional[str] = None
     ):
         """
         Get retriever for RAG queries.
@@ -198,20 +738,29 @@ class VectorStore:
             k: Number of documents to retrieve
             use_hybrid: If True, use hybrid retrieval (BM25 + Dense). Overrides use_bm25_only.
             use_bm25_only: If True (default), use BM25-only retrieval. If False and use_hybrid=False, use dense-only.
-            bm25_weight: Weight for BM25 results in hybrid ensemble (default 0.5)
-            dense_weight: Weight for dense results in hybrid ensemble (default 0.5)
+            bm25_weight: Weight for BM25 results in hybrid ensemble (default 0.1)
+            dense_weight: Weight for dense results in hybrid ensemble (default 0.9)
+            fetch_k: Hybrid only: candidates fetched from each retriever before fusion
+                     (default 20, at least k). The fused list is truncated to k, so
+                     callers keep k small without shrinking the RRF candidate pool.
+            source: Only retrieve chunks whose metadata["source"] matches (the
+                    PDF file stem set by ingest_pdf), e.g. per-PDF rule extraction
+        
+        Hybrid fusion uses weighted Reciprocal Rank Fusion with LangChain's fixed
+        c=60. Dense-weighted 0.9/0.1 follows published grid searches on technical
+        corpora: dense recall, with BM25 breaking ties on section numbers/acronyms.
         
         Returns:
             LangChain retriever:
-            - BM25Retriever if use_bm25_only=True (default)
-            - EnsembleRetriever if use_hybrid=True
+            - BM25SRetriever if use_bm25_only=True (default)
+            - ConcurrentEnsembleRetriever if use_hybrid=True
             - Dense retriever if use_bm25_only=False and use_hybrid=False
         
         Examples:
             # Default: BM25-only (validated best)
             retriever = vector_store.get_retriever(k=5)
             
-            # Hybrid retrieval (BM25 + Dense)
+            # Hybrid retrieval (BM25 + Dense), fuses 20 candidates each into top 5
             retriever = vector_store.get_retriever(k=5, use_hybrid=True)
             
             # Dense-only
@@ -219,37 +768,42 @@ class VectorStore:
         """
         # If hybrid requested, combine BM25 + Dense
         if use_hybrid and self.documents:
-            # Setup BM25 retriever
-            bm25_retriever = BM25Retriever.from_documents(
-                self.documents, 
-                k=k
-            )
+            # Pre-fusion candidate pool per retriever (post-fusion list is k)
+            fetch_k = max(fetch_k, k)
             
-            # Setup dense retriever
-            dense_retriever = self.vectorstore.as_retriever(
-                search_kwargs={"k": k}
+            # Setup BM25 retriever (cached BM25S index)
+            bm25_retriever = self._get_bm25_retriever(fetch_k, source)
+            
+            # Setup dense retriever (IDs only over the wire; payloads hydrated locally)
+            dense_retriever = QdrantIdRetriever(
+                vectorstore=self.vectorstore,
+                docs_by_id=self._docs_by_id,
+                k=fetch_k,
+                search_params=DENSE_SEARCH_PARAMS,
+                query_filter=self._source_filter(source)
             )
             
-            # Combine using EnsembleRetriever (Reciprocal Rank Fusion)
-            hybrid_retriever = EnsembleRetriever(
+            # Combine using Reciprocal Rank Fusion, querying both retrievers concurrently
+            hybrid_retriever = ConcurrentEnsembleRetriever(
                 retrievers=[bm25_retriever, dense_retriever],
-                weights=[bm25_weight, dense_weight]
+                weights=[bm25_weight, dense_weight],
+                k=k
             )
             
             return hybrid_retriever
         
         # Default: BM25-only (validated best technique)
         elif use_bm25_only and self.documents:
-            bm25_retriever = BM25Retriever.from_documents(
-                self.documents,
-                k=k
-            )
-            return bm25_retriever
+            return self._get_bm25_retriever(k, source)
         
         # Fallback: Dense-only (if BM25 not available or explicitly disabled)
         else:
             dense_retriever = self.vectorstore.as_retriever(
-                search_kwargs={"k": k}
+                search_kwargs={
+                    "k": k,
+                    "search_params": DENSE_SEARCH_PARAMS,
+                    "filter": self._source_filter(source)
+                }
             )
             return dense_retriever
     
@@ -267,4 +821,60 @@ class VectorStore:
         Returns:
             List of relevant Document objects
         """
-        return self.vectorstore.similarity_search(query, k=k)
\ No newline at end of file
+        return self.vectorstore.similarity_search(query, k=k)
+    
+    def similarity_search_batch(self, queries: List[str], k: int = 5) -> List[List[Document]]:
+        """
+        Dense similarity search for several queries at once.
+        
+        Embeds all queries in one batched (cached) call and sends a single
+        Qdrant batch query, instead of N embed + search round trips. Useful
+        for evaluation loops and multi-query rewriting.
+        
+        Args:
+            queries: Search queries
+            k: Number of results per query
+        
+        Returns:
+            One list of relevant Document objects per query (same order)
+        """
+        if not queries:
+            return []
+        
+        vectors = self.embeddings.embed_documents(queries)
+        requests = [
+            QueryRequest(query=vector, limit=k, with_payload=True, params=DENSE_SEARCH_PARAMS)
+            for vector in vectors
+        ]
+        responses = self.vectorstore.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=requests
+        )
+        
+        content_key = self.vectorstore.content_payload_key
+        metadata_key = self.vectorstore.metadata_payload_key
+        return [
+            [
+                Document(
+                    page_content=point.payload[content_key],
+                    metadata=point.payload.get(metadata_key) or {}
+                )
+                for point in response.points
+            ]
+            for response in responses
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_default_vector_store() -> VectorStore:
+    """
+    Get the process-wide default VectorStore instance.
+    
+    Building a VectorStore sets up the embedding cache and a Qdrant client,
+    so long-running workers share a single instance instead of constructing
+    one per call. Used by rule extraction and the chat endpoint.
+    
+    Returns:
+        Shared VectorStore instance (created on first call)
+    """
+    return VectorStore()
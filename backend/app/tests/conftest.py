@@ -0,0 +1,95 @@
+"""
+Shared pytest fixtures for the backend test suite.
+
+Run with: uv run pytest app/tests -n auto --dist=loadfile
+
+Tests that need the OpenAI API are marked `@pytest.mark.requires_openai` and
+are skipped at collection time when OPENAI_API_KEY is not set, before any of
+their fixtures (PDF ingest, vector store) run.
+
+Ingest/retrieval tests are parametrized over BUILDING_CODE_PDFS through the
+`pdf_path` fixture (missing PDFs are skipped). PDF parsing and embedding
+dominate runtime, so each PDF is ingested once per session (`ingested_chunks`)
+and shared through a pre-populated `vector_store`. Both also persist across
+runs: ingest_pdf() caches chunks on disk (keyed by PDF content hash + chunk
+params) and embeddings live in the on-disk embedding cache (keyed by model +
+text), so repeat runs skip PDF parsing and make no embedding API calls.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+
+# Add backend directory to path so 'app' module can be found
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# Load environment variables
+env_path = backend_dir / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+@pytest_asyncio.fixture
+async def client():
+    """
+    httpx AsyncClient calling the app in-process via ASGITransport.
+
+    Requests run on the test's own event loop (no TestClient thread hop and
+    per-request loop bootstrap), and can be issued concurrently with gather.
+    """
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        follow_redirects=True
+    ) as client:
+        yield client
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip `requires_openai` tests when OPENAI_API_KEY isn't set."""
+    if os.getenv("OPENAI_API_KEY"):
+        return
+
+    skip_openai = pytest.mark.skip(reason="OPENAI_API_KEY not set")
+    for item in items:
+        if "requires_openai" in item.keywords:
+            item.add_marker(skip_openai)
+
+
+# Building code PDFs the ingest/retrieval tests run against (one test per PDF)
+BUILDING_CODE_PDFS = ["National-Building-Code.pdf", "code_sample.pdf"]
+
+
+@pytest.fixture(scope="session", params=BUILDING_CODE_PDFS)
+def pdf_path(request) -> Path:
+    """Building code PDF used for ingest/retrieval tests; skips if missing."""
+    path = backend_dir / "app" / "data" / request.param
+    if not path.exists():
+        pytest.skip(f"{request.param} not found in {path.parent}")
+    return path
+
+
+@pytest.fixture(scope="session")
+def ingested_chunks(pdf_path):
+    """Chunks of the building code PDF, ingested once per session."""
+    from app.services.pdf_ingest import ingest_pdf
+
+    return ingest_pdf(str(pdf_path))
+
+
+@pytest.fixture(scope="session")
+def vector_store(ingested_chunks):
+    """VectorStore pre-populated with the ingested PDF chunks."""
+    from app.services.vector_store import VectorStore
+
+    vs = VectorStore()
+    vs.add_documents(ingested_chunks)
+    return vs
@@ -1,22 +1,50 @@
-# Quick test
-import sys
-from pathlib import Path
+"""
+Tests for the design loaders (rooms/doors CSV).
 
-# Add backend directory to path so 'app' module can be found
-backend_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_dir))
+Run with: uv run pytest app/tests/data_loader_test.py
+"""
+import os
+import shutil
 
-from app.services.design_loader import load_rooms, load_doors, load_design
+from app.models.domain import Door, Room
+from app.services.design_loader import DATA_DIR, load_rooms, load_doors, load_design
 
-# Test individual loaders
-rooms = load_rooms()
-print(f"Loaded {len(rooms)} rooms")
-print(rooms[0]) # Print first Room object
 
-doors = load_doors()
-print(f"Loaded {len(doors)} doors")
-print(doors[0])
+def test_load_rooms():
+    rooms = load_rooms()
+    assert len(rooms) > 0
+    assert all(isinstance(room, Room) for room in rooms)
 
-# Test combined loader
-rooms, doors = load_design()
-print(f"Design loaded: {len(rooms)} rooms, {len(doors)} doors")
\ No newline at end of file
+
+def test_load_doors():
+    doors = load_doors()
+    assert len(doors) > 0
+    assert all(isinstance(door, Door) for door in doors)
+
+
+def test_load_design():
+    rooms, doors = load_design()
+    assert len(rooms) == len(load_rooms())
+    assert len(doors) == len(load_doors())
+
+
+def test_load_design_cache_invalidates_on_edit(tmp_path):
+    """Test load_design() is cached, and editing a CSV reloads it."""
+    rooms_path = tmp_path / "rooms.csv"
+    doors_path = tmp_path / "doors.csv"
+    shutil.copy(DATA_DIR / "rooms.csv", rooms_path)
+    shutil.copy(DATA_DIR / "doors.csv", doors_path)
+
+    rooms, doors = load_design(rooms_path, doors_path)
+    warm_rooms, warm_doors = load_design(rooms_path, doors_path)
+    assert warm_rooms == rooms and warm_doors == doors
+
+    # Append a room and bump the mtime so the change is visible even on coarse clocks
+    with open(rooms_path, "a", encoding="utf-8") as f:
+        f.write("\nR999,Test Room,bedroom,1,12.0\n")  # CSV may lack a trailing newline
+    stat = rooms_path.stat()
+    os.utime(rooms_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    edited_rooms, _ = load_design(rooms_path, doors_path)
+    assert len(edited_rooms) == len(rooms) + 1
+    assert edited_rooms[-1].id == "R999"
@@ -1,20 +1,61 @@
-# Quick test
-import sys
-from pathlib import Path
+"""
+Tests for the compliance checker and the issues endpoints.
 
-# Add backend directory to path so 'app' module can be found
-backend_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_dir))
+Run with: uv run pytest app/tests/test_compliance_checker.py
+"""
+import orjson
+import pytest
 
 from app.services.design_loader import load_design
-from app.services.compliance_checker import check_compliance
+from app.services.compliance_checker import check_compliance, clear_compliance_cache
+from app.services.rules_seed import get_seeded_rules
 
-rooms, doors = load_design()
 
-issues = check_compliance(rooms, doors)
+def test_check_compliance_with_seeded_rules():
+    """Test compliance checking against the seeded rules (no LLM needed)."""
+    rooms, doors = load_design()
+    assert len(rooms) > 0, "Should have at least one room"
+    assert len(doors) > 0, "Should have at least one door"
 
-print(f"Found {len(issues)} compliance issues:")
-for issue in issues:
-    print(f"- {issue.message}")
-    print(f"  Code ref: {issue.code_ref}")
-    print()
\ No newline at end of file
+    issues = check_compliance(rooms, doors, rules=get_seeded_rules())
+    assert isinstance(issues, list), "Issues should be a list"
+
+    for issue in issues:
+        assert issue.element_id
+        assert issue.message
+        assert issue.code_ref
+
+
+def test_check_compliance_cache():
+    """Test cold and warm check_compliance() calls agree, and edits miss the cache."""
+    rooms, doors = load_design()
+    rules = get_seeded_rules()
+
+    clear_compliance_cache()
+    cold = check_compliance(rooms, doors, rules=rules)
+    warm = check_compliance(rooms, doors, rules=rules)
+    assert warm == cold
+    assert warm is not cold  # callers get their own list
+
+    # Shrinking every room below the minimum must be re-checked, not served from cache
+    small_rooms = [room.model_copy(update={"area_m2": 1.0}) for room in rooms]
+    issues = check_compliance(small_rooms, doors, rules=rules)
+    room_issue_ids = {issue.element_id for issue in issues if issue.element_type == "room"}
+    assert room_issue_ids == {room.id for room in rooms}
+
+
+@pytest.mark.asyncio
+async def test_issues_endpoint(client):
+    """Test /api/issues and /api/issues/summary."""
+    response = await client.get("/api/issues")
+    assert response.status_code == 200, response.text
+    issues = orjson.loads(response.content)
+    assert isinstance(issues, list), "Issues should be a list"
+
+    # Check issue structure
+    for key in ("element_id", "element_type", "rule_id", "message", "code_ref"):
+        assert all(key in issue for issue in issues)
+
+    response = await client.get("/api/issues/summary")
+    assert response.status_code == 200, response.text
+    assert "total" in orjson.loads(response.content)
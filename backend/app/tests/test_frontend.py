@@ -0,0 +1,43 @@
+"""
+Tests for the health endpoint, static files and frontend template.
+
+Run with: uv run pytest app/tests/test_frontend.py
+"""
+import orjson
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint(client):
+    """Test /health endpoint."""
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    ["/static/plan.png", "/static/styles.css", "/static/overlays.json"]
+)
+@pytest.mark.asyncio
+async def test_static_files(client, file_path):
+    """Test static file serving."""
+    response = await client.get(file_path)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert len(response.content) > 0
+
+    if file_path.endswith(".json"):
+        data = orjson.loads(response.content)
+        assert isinstance(data, list), "Overlays JSON should be a list"
+
+
+@pytest.mark.asyncio
+async def test_frontend_template(client):
+    """Test frontend HTML template renders."""
+    response = await client.get("/")
+    assert response.status_code == 200
+    html = response.text.lower()
+    assert "<html" in html or "<!doctype" in html
+    assert "plan" in html
+    assert "issues" in html
+    assert "chat" in html
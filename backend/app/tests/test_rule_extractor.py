@@ -0,0 +1,88 @@
+"""
+Tests for sync/async rule extraction with a mocked LLM and vector store.
+
+Run with: uv run pytest app/tests/test_rule_extractor.py
+"""
+import asyncio
+import re
+
+import orjson
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from app.services import rule_extractor
+from app.services.rules_seed import get_default_project_context
+
+
+class FakeVectorStore:
+    """Stand-in store: one chunk per indexed PDF, retrievable per source."""
+
+    def __init__(self):
+        self.indexed_sources = set()
+        self.documents = []
+
+    def get_retriever(self, k=5, source=None):
+        return RunnableLambda(
+            lambda query: [
+                doc for doc in self.documents
+                if source is None or doc.metadata["source"] == source
+            ][:k]
+        )
+
+
+def fake_index_pdf(pdf_path, vector_store):
+    """Index a chunk naming its PDF instead of parsing it."""
+    if pdf_path.stem not in vector_store.indexed_sources:
+        vector_store.indexed_sources.add(pdf_path.stem)
+        vector_store.documents.append(
+            Document(page_content=f"Rules of {pdf_path.stem}", metadata={"source": pdf_path.stem})
+        )
+
+
+def test_async_extraction_matches_sync(tmp_path, monkeypatch):
+    """Test each PDF is extracted from its own chunks, with the same rules/IDs sync and async."""
+    prompts = []
+
+    def fake_llm(prompt_value):
+        text = prompt_value.to_string()
+        prompts.append(text)
+        sources = sorted(set(re.findall(r"\[Source: (\w+),", text)))
+        # Every PDF answers with ID R003, so merging must rename the duplicates
+        return AIMessage(content=orjson.dumps([
+            {
+                "id": "R003",
+                "name": f"Minimum room area ({', '.join(sources)})",
+                "rule_type": "area_min",
+                "element_type": "room",
+                "min_value": 10.0
+            }
+        ]).decode())
+
+    monkeypatch.setattr(rule_extractor, "_index_pdf", fake_index_pdf)
+    monkeypatch.setattr(rule_extractor, "get_llm", lambda **kwargs: RunnableLambda(fake_llm))
+
+    pdf_paths = []
+    for name in ("code_a", "code_b"):
+        pdf_path = tmp_path / f"{name}.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        pdf_paths.append(pdf_path)
+    project_context = get_default_project_context()
+
+    sync_rules = rule_extractor.extract_rules_from_pdfs(
+        pdf_paths, project_context, vector_store=FakeVectorStore()
+    )
+    async_rules = asyncio.run(rule_extractor.extract_rules_from_pdfs_async(
+        pdf_paths, project_context, vector_store=FakeVectorStore()
+    ))
+
+    # One LLM call per PDF per run, each seeing only that PDF's chunks
+    assert len(prompts) == 4
+    assert all(len(set(re.findall(r"\[Source: (\w+),", prompt))) == 1 for prompt in prompts)
+
+    assert [rule.name for rule in sync_rules] == [
+        "Minimum room area (code_a)",
+        "Minimum room area (code_b)",
+    ]
+    assert len({rule.id for rule in sync_rules}) == 2
+    assert [rule.model_dump() for rule in async_rules] == [rule.model_dump() for rule in sync_rules]
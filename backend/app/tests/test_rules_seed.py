@@ -1,21 +1,71 @@
-# Quick test
-import sys
-from pathlib import Path
+"""
+Tests for the seeded rules.
 
-# Add backend directory to path so 'app' module can be found
-backend_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_dir))
+Run with: uv run pytest app/tests/test_rules_seed.py
+"""
+import pytest
 
-from app.services.rules_seed import get_seeded_rules, get_rules_for_element_type
+from app.services.rules_seed import get_seeded_rules, get_rule_by_id, get_rules_for_element_type
 
-# Test basic loading
-rules = get_seeded_rules()
-print(f"Total rules: {len(rules)}")
-print(rules[0])  # Should print first rule
 
-# Test filtering
-room_rules = get_rules_for_element_type("room")
-print(f"Room rules: {len(room_rules)}") # Should be 2
+def test_get_seeded_rules():
+    """Test the seeded rules load (2 room rules, 2 door rules)."""
+    rules = get_seeded_rules()
+    assert len(rules) == 4
+    assert sum(1 for rule in rules if rule.element_type == "room") == 2
+    assert sum(1 for rule in rules if rule.element_type == "door") == 2
 
-door_rules = get_rules_for_element_type("door")
-print(f"Door rules: {len(door_rules)}") # Should be 2
\ No newline at end of file
+
+def test_get_rule_by_id_seeded():
+    """Test seeded rules are found by ID."""
+    for rule in get_seeded_rules():
+        assert get_rule_by_id(rule.id) == rule
+
+
+@pytest.mark.requires_openai
+def test_get_rules_for_element_type():
+    """Test filtering all (seeded + extracted) rules by element type."""
+    room_rules = get_rules_for_element_type("room")
+    door_rules = get_rules_for_element_type("door")
+    assert room_rules and all(rule.element_type == "room" for rule in room_rules)
+    assert door_rules and all(rule.element_type == "door" for rule in door_rules)
+
+
+def test_get_all_rules_caches_per_pdf(tmp_path, monkeypatch):
+    """Test a failed PDF is skipped and retried alone, while the others stay cached."""
+    from app.models.domain import Rule
+    from app.services import rule_extractor, rules_seed, vector_store
+
+    for name in ("code_a", "code_b"):
+        (tmp_path / f"{name}.pdf").write_bytes(name.encode())
+    monkeypatch.setattr(rules_seed, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(rules_seed, "RULES_CACHE_DIR", tmp_path / "rules")
+    monkeypatch.setattr(vector_store, "get_default_vector_store", lambda: None)
+
+    calls = []
+
+    def fake_extract(pdf_path, store, project_context, max_rules=20, raise_on_error=False):
+        calls.append(pdf_path.stem)
+        if pdf_path.stem == "code_b" and calls.count("code_b") == 1:
+            raise RuntimeError("rate limited")
+        return [Rule(id="R003", name=f"Rule from {pdf_path.stem}", rule_type="text", element_type="room")]
+
+    monkeypatch.setattr(rule_extractor, "extract_rules_from_pdf", fake_extract)
+    rules_seed.clear_rules_cache()
+    try:
+        seeded_count = len(get_seeded_rules())
+
+        first = rules_seed.get_all_rules()
+        assert [rule.name for rule in first[seeded_count:]] == ["Rule from code_a"]
+
+        second = rules_seed.get_all_rules()
+        assert calls == ["code_a", "code_b", "code_b"]
+        assert [rule.name for rule in second[seeded_count:]] == ["Rule from code_a", "Rule from code_b"]
+        assert [rule.id for rule in second[seeded_count:]] == ["R003", "R100"]
+
+        # Callers get copies: renaming/mutating them doesn't touch the cache
+        second[-1].name = "changed"
+        assert rules_seed.get_all_rules()[-1].name == "Rule from code_b"
+        assert calls == ["code_a", "code_b", "code_b"]
+    finally:
+        rules_seed.clear_rules_cache()
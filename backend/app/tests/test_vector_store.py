@@ -1,71 +1,149 @@
 """
 Test vector store with hybrid retrieval (BM25 + Dense).
 
-Run with: uv run python app/tests/test_vector_store.py
+Run with: uv run pytest app/tests/test_vector_store.py
 
-Requires:
+Requires (retrieval tests):
 - OPENAI_API_KEY environment variable set
-- PDF file at app/data/National-Building-Code.pdf
+- A building code PDF in app/data/ (see BUILDING_CODE_PDFS in conftest.py;
+  each test runs once per PDF, missing PDFs are skipped)
+
+test_embedding_batching needs only the PDF: it counts OpenAI embedding
+requests against a patched client. test_similarity_search_batch needs
+neither: it indexes a few in-memory documents with patched embeddings.
 """
-import sys
-import os
-from pathlib import Path
-
-
-# Add backend directory to path so 'app' module can be found
-backend_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_dir))
-
-# Load environment variables if .env exists
-from dotenv import load_dotenv
-env_path = backend_dir / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-
-from app.services.vector_store import VectorStore
-from app.services.pdf_ingest import ingest_pdf
-
-def main():
-    """Test hybrid retrieval."""
-    # Check for OpenAI API key
-    if not os.getenv("OPENAI_API_KEY"):
-        print("Error: OPENAI_API_KEY environment variable not set")
-        print("Please set it in your .env file or export it:")
-        print("  export OPENAI_API_KEY='your-key-here'")
-        return
-    
-    print("Creating vector store...")
-    vs = VectorStore()
-    
-    # Check if PDF exists
-    pdf_path = backend_dir / "app" / "data" / "National-Building-Code.pdf"
-    if not pdf_path.exists():
-        print(f"Error: PDF not found at {pdf_path}")
-        print("Please ensure the PDF file exists in app/data/")
-        return
-    
-    print(f"Loading PDF from {pdf_path}...")
-    chunks = ingest_pdf(str(pdf_path))
-    print(f"Loaded {len(chunks)} chunks")
-    
-    print("Adding documents to vector store...")
-    vs.add_documents(chunks)
-    
-    print("Getting hybrid retriever (BM25 + Dense)...")
-    retriever = vs.get_retriever(k=5)
-    
-    # Test query
-    query = "What is the minimum bedroom area?"
-    print(f"\nQuery: {query}")
-    results = retriever.invoke(query)
-    print(f"Found {len(results)} results\n")
-    
-    # Show first result
-    if results:
-        print("First result:")
-        print(f"  Content: {results[0].page_content[:200]}...")
-        if results[0].metadata:
-            print(f"  Metadata: {results[0].metadata}")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+import math
+
+import pytest
+
+
+@pytest.mark.requires_openai
+def test_hybrid_retrieval(vector_store):
+    """Test hybrid retrieval returns at most k documents with content."""
+    retriever = vector_store.get_retriever(k=5, use_hybrid=True)
+    results = retriever.invoke("What is the minimum bedroom area?")
+
+    assert 0 < len(results) <= 5
+    assert all(doc.page_content for doc in results)
+
+
+def test_embedding_batching(ingested_chunks, tmp_path, monkeypatch):
+    """Test indexing embeds chunks in batched API requests, not one per chunk."""
+    import openai.resources.embeddings
+
+    from app.services.vector_store import INGEST_BATCH_SIZE, VectorStore
+
+    # OpenAIEmbeddings counts tokens with tiktoken (downloads its encoding once)
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        pytest.skip("tiktoken encoding not available offline")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    calls = []
+
+    def fake_create(self, *, input, **kwargs):
+        calls.append(len(input))
+        return {"data": [{"embedding": [1.0] + [0.0] * 1535} for _ in input]}
+
+    monkeypatch.setattr(openai.resources.embeddings.Embeddings, "create", fake_create)
+
+    # Fresh cache so every chunk needs embedding
+    vs = VectorStore(cache_dir=str(tmp_path / "embeddings"))
+    calls.clear()  # QdrantVectorStore embeds a probe text on construction
+    vs.add_documents(ingested_chunks)
+
+    assert sum(calls) >= len(set(doc.page_content for doc in ingested_chunks))
+    assert len(calls) <= math.ceil(len(ingested_chunks) / INGEST_BATCH_SIZE)
+
+
+def test_unknown_embedding_model_dimensions(tmp_path, monkeypatch):
+    """Test an unlisted embedding model's vector size is probed, with a clear error on failure."""
+    import openai.resources.embeddings
+
+    from app.services.vector_store import VectorStore
+
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        pytest.skip("tiktoken encoding not available offline")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def fake_create(self, *, input, **kwargs):
+        return {"data": [{"embedding": [1.0] + [0.0] * 63} for _ in input]}
+
+    monkeypatch.setattr(openai.resources.embeddings.Embeddings, "create", fake_create)
+
+    vs = VectorStore(embedding_model="custom-embedding", cache_dir=str(tmp_path / "a"))
+    assert vs.embedding_dimensions == 64
+
+    def failing_create(self, *, input, **kwargs):
+        raise RuntimeError("unknown model")
+
+    monkeypatch.setattr(openai.resources.embeddings.Embeddings, "create", failing_create)
+
+    with pytest.raises(ValueError, match="embedding_dimensions"):
+        VectorStore(embedding_model="custom-embedding", cache_dir=str(tmp_path / "b"))
+
+
+def test_similarity_search_batch(tmp_path, monkeypatch):
+    """Test N queries embed in one call and search in one Qdrant batch request, in input order."""
+    import zlib
+
+    from langchain_core.documents import Document
+    from qdrant_client import QdrantClient
+
+    from app.services.vector_store import ConcurrentOpenAIEmbeddings, VectorStore
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def fake_vector(text):
+        # Bag of words hashed into the 1536 dims, so shared words score higher
+        vector = [0.0] * 1536
+        for word in text.lower().split():
+            vector[zlib.crc32(word.encode()) % 1536] += 1.0
+        return vector
+
+    embed_calls = []
+
+    def fake_embed_documents(self, texts, chunk_size=None, **kwargs):
+        embed_calls.append(list(texts))
+        return [fake_vector(text) for text in texts]
+
+    monkeypatch.setattr(ConcurrentOpenAIEmbeddings, "embed_documents", fake_embed_documents)
+    monkeypatch.setattr(ConcurrentOpenAIEmbeddings, "embed_query", lambda self, text: fake_vector(text))
+
+    batch_requests = []
+    query_batch_points = QdrantClient.query_batch_points
+
+    def spy_query_batch_points(self, collection_name, requests, **kwargs):
+        batch_requests.append(len(requests))
+        return query_batch_points(self, collection_name, requests, **kwargs)
+
+    monkeypatch.setattr(QdrantClient, "query_batch_points", spy_query_batch_points)
+
+    vs = VectorStore(cache_dir=str(tmp_path / "embeddings"))
+    vs.add_documents([
+        Document(page_content="bedroom minimum area", metadata={"source": "code", "page": 1}),
+        Document(page_content="door clear width", metadata={"source": "code", "page": 2}),
+        Document(page_content="stair riser height", metadata={"source": "code", "page": 3}),
+    ])
+    embed_calls.clear()
+
+    queries = ["stair height", "bedroom area", "door width"]
+    results = vs.similarity_search_batch(queries, k=1)
+
+    assert embed_calls == [queries]
+    assert batch_requests == [len(queries)]
+    assert [docs[0].page_content for docs in results] == [
+        "stair riser height",
+        "bedroom minimum area",
+        "door clear width",
+    ]
+    assert all(isinstance(docs[0], Document) for docs in results)
+    assert [docs[0].metadata["page"] for docs in results] == [3, 1, 2]
+    assert vs.similarity_search_batch([]) == []
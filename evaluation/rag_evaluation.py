@@ -27,8 +27,7 @@ def _(Path, os):
     # Load the OpenAI key from the file
     openai_key_path = Path(__file__).parent / "OpenAI_key.txt"
     if openai_key_path.exists():
-        with open(openai_key_path, "r") as file:
-            os.environ["OPENAI_API_KEY"] = file.read().strip()
+        os.environ["OPENAI_API_KEY"] = openai_key_path.read_text(encoding="utf-8").strip()
     else:
         # Fallback to .env file
         from dotenv import load_dotenv
@@ -48,14 +47,22 @@ def _(Path, os):
     # Apply nest_asyncio to handle async issues with Ragas
     nest_asyncio.apply()
 
-    # Set LangSmith API key (required for tracing and cost/latency tracking)
-    os.environ["LANGSMITH_TRACING_V2"] = "true"
+    # Trace chain runs to LangSmith (cost/latency tracking). Off by default for
+    # evaluation runs: scores come from RAGAS, and each traced run adds
+    # callback/export work to every chain call.
+    ENABLE_TRACING = False
+    os.environ["LANGSMITH_TRACING_V2"] = "true" if ENABLE_TRACING else "false"
+
+    # When tracing, run tracer callbacks in the background instead of inline
+    # with chain calls (the LangSmith client batches uploads on its own thread)
+    os.environ["LANGCHAIN_CALLBACKS_BACKGROUND"] = "true"
+
+    # Set LangSmith API key (tracing and the results dataset)
 
     # Load the LangSmith key from the file
     langsmith_key_path = Path(__file__).parent / "langsmith-api.txt"
     if langsmith_key_path.exists():
-        with open(langsmith_key_path, "r") as langsmith_file:
-            os.environ["LANGSMITH_API_KEY"] = langsmith_file.read().strip()
+        os.environ["LANGSMITH_API_KEY"] = langsmith_key_path.read_text(encoding="utf-8").strip()
     else:
         # Fallback to environment variable
         if not os.getenv("LANGSMITH_API_KEY"):
@@ -135,6 +142,25 @@ def _():
     return VectorStore, get_llm, ingest_pdf
 
 
+@app.cell
+def _():
+    # One connection-pooled sync HTTP client shared by every blocking OpenAI
+    # call below (RAG chat model, RAGAS embeddings, and all four retrievers),
+    # instead of each component opening its own default-sized pool. Async
+    # calls are left to each component's own AsyncClient: an httpx.AsyncClient
+    # is bound to the loop it's used on, and this cell can't close one there.
+    import atexit as _atexit
+    from app.core.http_clients import create_http_client
+
+    http_client = create_http_client()
+
+    # Close pooled connections when the notebook process exits
+    _atexit.register(http_client.close)
+
+    print("✔ Shared HTTP client created")
+    return (http_client,)
+
+
 @app.cell
 def _(Path, ingest_pdf):
     # Load building code PDFs
@@ -191,17 +217,38 @@ def _(mo):
 
 
 @app.cell
-def _(get_llm):
-    from langchain_openai import OpenAIEmbeddings
+def _(get_llm, http_client):
+    from app.services.vector_store import CacheBackedEmbeddings
+    from langchain_core.rate_limiters import InMemoryRateLimiter
+
+    # Token bucket sized to the account's chat-completions RPM: concurrent RAG
+    # chains and RAGAS metric calls draw from it before each request, so bursts
+    # stay inside the rate envelope instead of tripping 429s and backing off
+    OPENAI_CHAT_RPM = 500
+    chat_rate_limiter = InMemoryRateLimiter(
+        requests_per_second=OPENAI_CHAT_RPM / 60,
+        check_every_n_seconds=0.05,
+        max_bucket_size=16  # burst up to the evaluation's in-flight limit
+    )
 
     # Setup LLM for RAG chains and RAGAS
-    chat_model = get_llm(provider="openai", model_name="gpt-4o-mini", temperature=0.0)
+    chat_model = get_llm(
+        provider="openai",
+        model_name="gpt-4o-mini",
+        temperature=0.0,
+        http_client=http_client,
+        rate_limiter=chat_rate_limiter
+    )
 
-    # Setup embeddings for RAGAS
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+    # Setup embeddings for RAGAS, cached on disk (documents and queries) so the
+    # golden questions are embedded once across metrics, retrievers and re-runs
+    embeddings = CacheBackedEmbeddings(
+        model="text-embedding-3-small",
+        http_client=http_client
+    ).get_embeddings()
 
     print("✔ LLM and embeddings configured")
-    return OpenAIEmbeddings, chat_model, embeddings
+    return chat_model, embeddings
 
 
 @app.cell
@@ -226,7 +273,8 @@ def _(mo):
 
 @app.cell
 def _():
-    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.messages import HumanMessage
+    from langchain_core.runnables import RunnableLambda
 
     RAG_TEMPLATE = """\
     You are a helpful assistant specializing in building codes and architectural compliance.
@@ -242,7 +290,13 @@ def _():
     {context}
     """
 
-    rag_prompt = ChatPromptTemplate.from_template(RAG_TEMPLATE)
+    def format_rag_prompt(inputs):
+        """Fill RAG_TEMPLATE directly (same single human message as ChatPromptTemplate.from_template)."""
+        return [HumanMessage(content=RAG_TEMPLATE.format(question=inputs["question"], context=inputs["context"]))]
+
+    # Plain str.format per call instead of a prompt-template Runnable (no
+    # input validation / PromptValue layer); drop-in for `rag_prompt | chat_model`
+    rag_prompt = RunnableLambda(format_rag_prompt)
     print("✔ RAG prompt template created")
     return (rag_prompt,)
 
@@ -254,7 +308,7 @@ def _(mo):
 
     We'll create 4 retrievers:
     1. Dense-only (from VectorStore with use_hybrid=False)
-    2. BM25-only (from langchain_community)
+    2. BM25-only (bm25s index from VectorStore)
     3. Hybrid (from VectorStore with use_hybrid=True)
     4. Parent-Document (from day_5 pattern)
     """)
@@ -262,52 +316,59 @@ def _(mo):
 
 
 @app.cell
-def _(VectorStore, eval_chunks):
-    # Technique 1: Dense-only retriever
-    # Create a separate vector store for dense-only (to avoid conflicts)
-    dense_vectorstore = VectorStore(
-        collection_name="dense_only_eval",
-        use_memory=True
+def _(VectorStore, eval_chunks, http_client):
+    from qdrant_client import QdrantClient
+
+    # One in-memory Qdrant instance for every evaluation collection
+    # (distinct collection names: "eval_chunks", "parent_document_eval")
+    shared_qdrant = QdrantClient(location=":memory:")
+
+    # Shared vector store for the dense-only and hybrid techniques: both search
+    # the same embedded chunks, so eval_chunks are embedded and indexed once.
+    # get_retriever() returns a new retriever per call, so they don't conflict.
+    eval_vectorstore = VectorStore(
+        collection_name="eval_chunks",
+        use_memory=True,
+        http_client=http_client,
+        client=shared_qdrant
     )
-    dense_vectorstore.add_documents(eval_chunks)
-    dense_retriever = dense_vectorstore.get_retriever(k=5, use_hybrid=False)
+    eval_vectorstore.add_documents(eval_chunks)
+
+    # Technique 1: Dense-only retriever (use_bm25_only=False: BM25 is the default)
+    dense_retriever = eval_vectorstore.get_retriever(k=5, use_hybrid=False, use_bm25_only=False)
 
     print("✔ Dense-only retriever created")
-    return (dense_retriever,)
+    return dense_retriever, eval_vectorstore, shared_qdrant
 
 
 @app.cell
-def _(eval_chunks):
-    # Technique 2: BM25-only retriever
-    from langchain_community.retrievers import BM25Retriever
-
-    bm25_retriever = BM25Retriever.from_documents(eval_chunks, k=5)
+def _(eval_vectorstore):
+    # Technique 2: BM25-only retriever (VectorStore default). Uses the bm25s
+    # index built from the corpus tokenized once in add_documents(): queries
+    # are scored against precomputed sparse matrices instead of rank_bm25's
+    # pure-Python loop over every chunk.
+    bm25_retriever = eval_vectorstore.get_retriever(k=5, use_bm25_only=True)
 
     print("✔ BM25-only retriever created")
     return (bm25_retriever,)
 
 
 @app.cell
-def _(VectorStore, eval_chunks):
-    # Technique 3: Hybrid retriever (BM25 + Dense)
-    hybrid_vectorstore = VectorStore(
-        collection_name="hybrid_eval",
-        use_memory=True
-    )
-    hybrid_vectorstore.add_documents(eval_chunks)
-    hybrid_retriever = hybrid_vectorstore.get_retriever(k=5, use_hybrid=True)
+def _(eval_vectorstore):
+    # Technique 3: Hybrid retriever (BM25 + Dense), over the shared vector store
+    hybrid_retriever = eval_vectorstore.get_retriever(k=5, use_hybrid=True)
 
     print("✔ Hybrid retriever created")
     return (hybrid_retriever,)
 
 
 @app.cell
-def _(OpenAIEmbeddings, eval_chunks):
+def _(eval_chunks, eval_vectorstore, shared_qdrant):
     # Technique 4: Parent-Document Retriever
     from langchain.retrievers import ParentDocumentRetriever
-    from langchain.storage import InMemoryStore
+    from langchain_core.stores import BaseStore
     from langchain_text_splitters import RecursiveCharacterTextSplitter
-    from qdrant_client import QdrantClient, models
+    from qdrant_client import models
     from langchain_qdrant import QdrantVectorStore
 
     # Parent documents (use evaluation chunks as parents)
@@ -316,24 +377,60 @@ def _(OpenAIEmbeddings, eval_chunks):
     # Child splitter (smaller chunks for search)
     child_splitter = RecursiveCharacterTextSplitter(chunk_size=750)
 
-    # Create separate vectorstore for parent-document
-    parent_client = QdrantClient(location=":memory:")
-    parent_client.create_collection(
+    # Create a separate collection for parent-document (child chunks) on the
+    # shared client. In-memory (local mode) Qdrant searches exact float32
+    # vectors and ignores HNSW/quantization config, so the collection only
+    # mirrors VectorStore's DOT distance (embeddings are unit-length: same
+    # ranking as COSINE, no per-query norm).
+    shared_qdrant.create_collection(
         collection_name="parent_document_eval",
         vectors_config=models.VectorParams(
             size=1536,  # OpenAI text-embedding-3-small
-            distance=models.Distance.COSINE
+            distance=models.Distance.DOT
         )
     )
 
     parent_vectorstore = QdrantVectorStore(
         collection_name="parent_document_eval",
-        embedding=OpenAIEmbeddings(model="text-embedding-3-small"),
-        client=parent_client
+        distance=models.Distance.DOT,
+        # Same cached, batched embeddings as the shared vector store
+        # (child chunks are cached on disk across notebook runs)
+        embedding=eval_vectorstore.embeddings,
+        client=shared_qdrant
     )
 
-    # Create docstore for parents
-    store = InMemoryStore()
+    class ListStore(BaseStore):
+        """Parent docstore backed by a list; keys are list indices as strings ("0", "1", ...)."""
+
+        def __init__(self):
+            self._docs = []
+
+        def mget(self, keys):
+            return [
+                self._docs[int(key)] if int(key) < len(self._docs) else None
+                for key in keys
+            ]
+
+        def mset(self, key_value_pairs):
+            for key, doc in key_value_pairs:
+                idx = int(key)
+                if idx >= len(self._docs):
+                    self._docs.extend([None] * (idx + 1 - len(self._docs)))
+                self._docs[idx] = doc
+
+        def mdelete(self, keys):
+            for key in keys:
+                if int(key) < len(self._docs):
+                    self._docs[int(key)] = None
+
+        def yield_keys(self, *, prefix=None):
+            for idx, doc in enumerate(self._docs):
+                if doc is not None and (prefix is None or str(idx).startswith(prefix)):
+                    yield str(idx)
+
+    # Create docstore for parents (list indexed by parent position: no dict
+    # of string keys, since parents are only ever looked up by their ID)
+    store = ListStore()
 
     # Create parent-document retriever
     parent_document_retriever = ParentDocumentRetriever(
@@ -342,8 +439,16 @@ def _(OpenAIEmbeddings, eval_chunks):
         child_splitter=child_splitter
     )
 
-    # Add documents
-    parent_document_retriever.add_documents(parent_docs, ids=None)
+    # Add documents. The retriever already splits every parent before one
+    # vectorstore.add_documents() call and one docstore.mset(); batch_size
+    # (QdrantVectorStore defaults to 64) makes that call embed all children in
+    # one concurrent, cached embed_documents() pass and upsert them in bulk,
+    # as VectorStore.add_documents() does
+    parent_document_retriever.add_documents(
+        parent_docs,
+        ids=[str(idx) for idx in range(len(parent_docs))],
+        batch_size=eval_vectorstore.cached_embeddings_wrapper.batch_size
+    )
 
     print("✔ Parent-Document retriever created")
     return (parent_document_retriever,)
@@ -361,26 +466,25 @@ def _(mo):
 
 @app.cell
 def _(chat_model, dense_retriever, rag_prompt):
-    from langchain_core.runnables import RunnablePassthrough
+    from langchain_core.runnables import RunnableParallel
     from operator import itemgetter
 
-    # Technique 1: Dense-only RAG chain
+    # Technique 1: Dense-only RAG chain (RunnableParallel, not a dict literal:
+    # `dict | dict` would be a plain dict merge rather than a chain)
     dense_retrieval_chain = (
-        {"context": itemgetter("question") | dense_retriever, "question": itemgetter("question")}
-        | RunnablePassthrough.assign(context=itemgetter("context"))
+        RunnableParallel(context=itemgetter("question") | dense_retriever, question=itemgetter("question"))
         | {"response": rag_prompt | chat_model, "context": itemgetter("context")}
     )
 
     print("✔ Dense-only RAG chain created")
-    return RunnablePassthrough, dense_retrieval_chain, itemgetter
+    return RunnableParallel, dense_retrieval_chain, itemgetter
 
 
 @app.cell
-def _(RunnablePassthrough, bm25_retriever, chat_model, itemgetter, rag_prompt):
+def _(RunnableParallel, bm25_retriever, chat_model, itemgetter, rag_prompt):
     # Technique 2: BM25-only RAG chain
     bm25_retrieval_chain = (
-        {"context": itemgetter("question") | bm25_retriever, "question": itemgetter("question")}
-        | RunnablePassthrough.assign(context=itemgetter("context"))
+        RunnableParallel(context=itemgetter("question") | bm25_retriever, question=itemgetter("question"))
         | {"response": rag_prompt | chat_model, "context": itemgetter("context")}
     )
 
@@ -390,7 +494,7 @@ def _(RunnablePassthrough, bm25_retriever, chat_model, itemgetter, rag_prompt):
 
 @app.cell
 def _(
-    RunnablePassthrough,
+    RunnableParallel,
     chat_model,
     hybrid_retriever,
     itemgetter,
@@ -398,8 +502,7 @@ def _(
 ):
     # Technique 3: Hybrid RAG chain
     hybrid_retrieval_chain = (
-        {"context": itemgetter("question") | hybrid_retriever, "question": itemgetter("question")}
-        | RunnablePassthrough.assign(context=itemgetter("context"))
+        RunnableParallel(context=itemgetter("question") | hybrid_retriever, question=itemgetter("question"))
         | {"response": rag_prompt | chat_model, "context": itemgetter("context")}
     )
 
@@ -409,7 +512,7 @@ def _(
 
 @app.cell
 def _(
-    RunnablePassthrough,
+    RunnableParallel,
     chat_model,
     itemgetter,
     parent_document_retriever,
@@ -417,8 +520,7 @@ def _(
 ):
     # Technique 4: Parent-Document RAG chain
     parent_document_retrieval_chain = (
-        {"context": itemgetter("question") | parent_document_retriever, "question": itemgetter("question")}
-        | RunnablePassthrough.assign(context=itemgetter("context"))
+        RunnableParallel(context=itemgetter("question") | parent_document_retriever, question=itemgetter("question"))
         | {"response": rag_prompt | chat_model, "context": itemgetter("context")}
     )
 
@@ -474,7 +576,8 @@ def _(
     # Check if golden dataset already exists
     if golden_dataset_path.exists():
         print(f"📂 Loading existing golden dataset from {golden_dataset_path}")
-        golden_df = pd.read_csv(golden_dataset_path)
+        # pyarrow parser + Arrow-backed columns (pyarrow ships with `datasets`)
+        golden_df = pd.read_csv(golden_dataset_path, engine="pyarrow", dtype_backend="pyarrow")
         print(f"✔ Loaded {len(golden_df)} test examples")
     else:
         print("🔨 Generating new golden dataset...")
@@ -484,6 +587,7 @@ def _(
             from ragas.testset.synthesizers import SingleHopSpecificQuerySynthesizer
             from ragas.testset.graph import KnowledgeGraph, Node, NodeType
             from ragas.testset.transforms import apply_transforms, default_transforms
+            import re
 
             # Filter chunks that likely contain measurements and technical requirements
             # This targets the sections with specific building code measurements
@@ -494,17 +598,22 @@ def _(
                 'ceiling', 'egress', 'accessibility', 'habitable', 'clear'
             ]
 
-            # Filter chunks containing measurement-related keywords
+            # Filter chunks containing measurement-related keywords: one
+            # case-insensitive pass per chunk (no per-keyword .lower() copies)
+            keyword_pattern = re.compile(
+                "|".join(re.escape(keyword) for keyword in measurement_keywords),
+                re.IGNORECASE
+            )
             chunk_subset = [
-                chunk for chunk in eval_chunks 
-                if any(keyword.lower() in chunk.page_content.lower() 
-                      for keyword in measurement_keywords)
+                chunk for chunk in eval_chunks
+                if keyword_pattern.search(chunk.page_content)
             ]
 
             # Limit to 50 chunks for knowledge graph generation
             if len(chunk_subset) > 50:
+                matching_count = len(chunk_subset)
                 chunk_subset = chunk_subset[:50]
-                print(f"Selected 50 chunks (out of {len([c for c in eval_chunks if any(kw.lower() in c.page_content.lower() for kw in measurement_keywords)])} matching) containing measurement-related content")
+                print(f"Selected 50 chunks (out of {matching_count} matching) containing measurement-related content")
             elif len(chunk_subset) < 10:
                 # Fallback: use middle chunks if not enough matches
                 print(f"⚠ Only found {len(chunk_subset)} chunks with measurement keywords. Using middle chunks as fallback...")
@@ -647,10 +756,14 @@ def _(mo):
 
 @app.cell
 def _():
-    from ragas import evaluate
+    from ragas import aevaluate
+    from ragas.run_config import RunConfig
     from ragas.metrics import context_precision, context_recall, answer_relevancy
     from datasets import Dataset
+    from langchain_core.runnables import RunnableLambda
+    import asyncio
     import time
+    import numpy as np
 
     # Define retriever-specific RAGAS metrics
     ragas_metrics = [context_precision, context_recall, answer_relevancy]
@@ -659,118 +772,218 @@ def _():
     print("* `context_precision`: Measures precision of retrieved context.")
     print("* `context_recall`: Measures recall of retrieved context.")
     print("* `answer_relevancy`: Measures relevancy of retrieved context to query.")
-    return Dataset, evaluate, ragas_metrics, time
+    return (
+        Dataset,
+        RunConfig,
+        RunnableLambda,
+        aevaluate,
+        asyncio,
+        np,
+        ragas_metrics,
+        time,
+    )
 
 
 @app.cell
 def _(
     Dataset,
-    evaluate,
+    RunConfig,
+    RunnableLambda,
+    aevaluate,
+    asyncio,
     generator_embeddings,
     generator_llm,
+    np,
     ragas_metrics,
     time,
 ):
-    def evaluate_retriever_with_ragas(rag_chain, retriever_name, golden_dataset_df, delay_between_questions=0):
-        """
-        Evaluate a RAG chain using RAGAS metrics
+    # RAGAS fans metric calls (one or more LLM/embedding requests per row and
+    # metric) out over its async executor; allow plenty in flight at once
+    ragas_run_config = RunConfig(max_workers=32, timeout=120)
 
-        Args:
-            rag_chain: The RAG chain to evaluate (must return dict with 'response' and 'context' keys)
-            retriever_name: Name identifier for the retriever
-            golden_dataset_df: DataFrame with golden dataset (columns: user_input, reference, reference_contexts)
-            delay_between_questions: Delay in seconds between questions (for rate-limited APIs)
-
-        Returns:
-            dict: Contains ragas_results (dict of metric scores), latency (float), and formatted_dataset
-        """
-
-        print(f"\n{'='*60}")
-        print(f"Evaluation: {retriever_name}")
-        print(f"{'='*60}")
-        if delay_between_questions > 0:
-            print(f"⚠ Rate limiting: {delay_between_questions}s delay between questions")
-
-        questions = golden_dataset_df["user_input"].tolist()
-        ground_truths = golden_dataset_df['reference'].tolist()
-
-        answers = []
-        contexts_list = []
-        latencies = []
-
-        # Run RAG chain for each question
-        for idx, question in enumerate(questions):
-            start_time = time.time()
-
-            # Invoke chain - expects {"question": ...} and returns dict with "response" and "context"
-            result = rag_chain.invoke({"question": question})
-
-            latency = time.time() - start_time
-            latencies.append(latency)
-
-            # Extract the answers and contexts
-            if isinstance(result["response"], str):
-                answer = result["response"]
-            else:
-                answer = result["response"].content if hasattr(result["response"], 'content') else str(result["response"])
-
-            # Extract contents
-            contexts = [doc.page_content if hasattr(doc, 'page_content') else str(doc) for doc in result["context"]]
-            contexts_list.append(contexts)
-            answers.append(answer)
-
-            # Add delay to respect rate limits (except after last question)
-            if delay_between_questions > 0 and idx < len(questions) - 1:
-                print(f" Question {idx+1}/{len(questions)} complete. Waiting {delay_between_questions}s...")
-                time.sleep(delay_between_questions)
-
-        # Format as HuggingFace Dataset for RAGAS
-        formatted_dataset = Dataset.from_dict({
-            "question": questions,
-            "answer": answers,
-            "contexts": contexts_list,
-            "ground_truth": ground_truths
-        })
-
-        # Run RAGAS evaluation
-        print(f"Running RAGAS evaluation...")
+    async def run_ragas_evaluation(formatted_dataset):
+        """Run RAGAS metrics on a formatted dataset (on the caller's loop; falls back to simpler configs)."""
         try:
-            ragas_results = evaluate(
+            return await aevaluate(
                 dataset=formatted_dataset,
                 metrics=ragas_metrics,
                 llm=generator_llm,
-                embeddings=generator_embeddings
+                embeddings=generator_embeddings,
+                run_config=ragas_run_config
             )
         except (TypeError, AttributeError) as e:
             # Fallback: try without explicit embeddings parameter
             print(f"⚠ First attempt failed, trying alternative configuration...")
             try:
-                ragas_results = evaluate(
+                return await aevaluate(
                     dataset=formatted_dataset,
                     metrics=ragas_metrics,
-                    llm=generator_llm
+                    llm=generator_llm,
+                    run_config=ragas_run_config
                 )
             except Exception as e2:
                 # Final fallback: basic evaluation
                 print(f"⚠ Using basic evaluation...")
-                ragas_results = evaluate(
+                return await aevaluate(
                     dataset=formatted_dataset,
-                    metrics=ragas_metrics
+                    metrics=ragas_metrics,
+                    run_config=ragas_run_config
                 )
-        avg_latency = sum(latencies) / len(latencies) if latencies else 0
 
-        print(f"✔ Evaluation complete for {retriever_name}")
-        print(f"   Average latency: {avg_latency:.3f}s")
+    async def run_rag_chain(rag_chain, retriever_name, golden_dataset_df, concurrency=8, semaphore=None):
+        """
+        Answer every golden question with a RAG chain (no scoring).
+
+        Questions run concurrently (retrieval + LLM answer calls are I/O-bound):
+        every question is started with `ainvoke` and gathered, with at most
+        `concurrency` in flight at once to stay under rate limits. Each question
+        is retried with exponential backoff (e.g. on 429s). Answers are streamed
+        (`astream`) and collected, so the event loop services every in-flight
+        response as tokens arrive.
+
+        Args:
+            rag_chain: The RAG chain to run (must return dict with 'response' and 'context' keys)
+            retriever_name: Name identifier for the retriever
+            golden_dataset_df: DataFrame with golden dataset (columns: user_input, reference, reference_contexts)
+            concurrency: Maximum number of questions in flight at once
+            semaphore: Optional asyncio.Semaphore shared with other chains
+                       running concurrently (overrides `concurrency`), so the
+                       total number of in-flight requests stays bounded
+
+        Returns:
+            dict: Contains answers, contexts (per question), latency (average, float), latencies
+                  and wall_time (seconds for all questions)
+        """
+        print(f"Running RAG chain: {retriever_name}")
+
+        questions = golden_dataset_df["user_input"].tolist()
+
+        async def collect_stream(inputs):
+            """Stream the chain and merge its chunks into the same output dict as ainvoke."""
+            result = None
+            async for chunk in rag_chain.astream(inputs):
+                # Output chunks are AddableDicts: "context" arrives once,
+                # "response" message chunks are concatenated
+                result = chunk if result is None else result + chunk
+            return result
+
+        # Retry transient API errors (rate limits, timeouts) with exponential backoff
+        # (wrapping the collector, since with_retry doesn't retry astream itself)
+        chain_with_retry = RunnableLambda(collect_stream).with_retry(
+            stop_after_attempt=3, wait_exponential_jitter=True
+        )
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(concurrency)
+
+        # Preallocated per-question results (filled by index as questions finish)
+        answers = [""] * len(questions)
+        contexts_list = [None] * len(questions)
+        latencies_ns = [0] * len(questions)
+
+        async def run_question(idx, question):
+            async with semaphore:
+                # Monotonic clock: unaffected by NTP/wall-clock adjustments
+                start_ns = time.perf_counter_ns()
+                # Invoke chain - expects {"question": ...} and returns dict with "response" and "context"
+                result = await chain_with_retry.ainvoke({"question": question})
+                latencies_ns[idx] = time.perf_counter_ns() - start_ns
+
+            # Extract the answer (AIMessage.content, or the response itself if a string)
+            answers[idx] = str(getattr(result["response"], "content", result["response"]))
+
+            # Extract contents
+            contexts_list[idx] = [str(getattr(doc, "page_content", doc)) for doc in result["context"]]
+
+        # Run RAG chain for all questions concurrently
+        wall_start_ns = time.perf_counter_ns()
+        await asyncio.gather(*(run_question(idx, question) for idx, question in enumerate(questions)))
+        wall_time = (time.perf_counter_ns() - wall_start_ns) * 1e-9
+
+        # Convert to seconds once. avg_latency stays the mean per-question call
+        # time (it feeds the latency score); wall time / N depends on the
+        # concurrency limit and on other chains sharing the semaphore, so it's
+        # reported separately as throughput.
+        latencies = np.asarray(latencies_ns, dtype=np.float64) * 1e-9
+        avg_latency = float(latencies.mean()) if latencies.size else 0.0
+        print(
+            f"✔ {retriever_name}: {len(questions)} questions in {wall_time:.2f}s wall "
+            f"(average latency {avg_latency:.3f}s)"
+        )
 
         return {
-            "ragas_results": ragas_results,
+            "answers": answers,
+            "contexts": contexts_list,
             "latency": avg_latency,
-            "formatted_dataset": formatted_dataset,
-            "latencies": latencies
+            "latencies": latencies.tolist(),
+            "wall_time": wall_time
         }
 
-    print("✔ Helper function created")
-    return (evaluate_retriever_with_ragas,)
+    async def evaluate_retrievers_with_ragas(retriever_chains, golden_dataset_df, max_in_flight=16):
+        """
+        Evaluate several RAG chains using RAGAS metrics, in one RAGAS run
+
+        All chains answer the golden questions concurrently (one semaphore
+        bounds in-flight requests across chains). Their rows are then
+        concatenated into a single dataset and scored with ONE `aevaluate()`
+        call, so RAGAS parallelizes metric calls across every retriever's rows
+        at once instead of four sequential runs. Per-row scores are split back
+        by retriever (row order is preserved).
+
+        Args:
+            retriever_chains: Dict of retriever name -> RAG chain
+            golden_dataset_df: DataFrame with golden dataset (columns: user_input, reference, reference_contexts)
+            max_in_flight: Maximum RAG chain requests in flight across all chains
+
+        Returns:
+            dict: retriever name -> {"scores", "latency", "latencies"}, or the
+                  Exception raised while running that retriever's chain
+        """
+        questions = golden_dataset_df["user_input"].tolist()
+        ground_truths = golden_dataset_df['reference'].tolist()
+
+        # Answer the golden questions with every chain concurrently
+        shared_semaphore = asyncio.Semaphore(max_in_flight)
+        chain_outputs = await asyncio.gather(
+            *(
+                run_rag_chain(rag_chain, retriever_name, golden_dataset_df, semaphore=shared_semaphore)
+                for retriever_name, rag_chain in retriever_chains.items()
+            ),
+            return_exceptions=True
+        )
+        outputs = dict(zip(retriever_chains, chain_outputs))
+        succeeded = [name for name, output in outputs.items() if not isinstance(output, Exception)]
+
+        # Format all retrievers' rows as one HuggingFace Dataset for RAGAS
+        formatted_dataset = Dataset.from_dict({
+            "question": questions * len(succeeded),
+            "answer": [answer for name in succeeded for answer in outputs[name]["answers"]],
+            "contexts": [contexts for name in succeeded for contexts in outputs[name]["contexts"]],
+            "ground_truth": ground_truths * len(succeeded)
+        })
+
+        evaluation_results = {name: output for name, output in outputs.items() if isinstance(output, Exception)}
+        if not succeeded:
+            return evaluation_results
+
+        # Run RAGAS once over every row, awaited on the notebook's loop (no
+        # worker thread, where nest_asyncio's patched loop lookups don't apply)
+        print(f"\nRunning RAGAS evaluation on {len(formatted_dataset)} rows ({len(succeeded)} retrievers)...")
+        ragas_results = await run_ragas_evaluation(formatted_dataset)
+
+        # Split per-row scores (metric name -> score dicts; no to_pandas() frame)
+        # back by retriever (contiguous blocks of len(questions) rows)
+        for idx, name in enumerate(succeeded):
+            evaluation_results[name] = {
+                "scores": ragas_results.scores[idx * len(questions):(idx + 1) * len(questions)],
+                "latency": outputs[name]["latency"],
+                "latencies": outputs[name]["latencies"]
+            }
+            print(f"✔ Evaluation complete for {name}")
+
+        return evaluation_results
+
+    print("✔ Helper functions created")
+    return (evaluate_retrievers_with_ragas,)
 
 
 @app.cell(hide_code=True)
@@ -786,13 +999,17 @@ def _(mo):
 @app.cell
 def _(
     Path,
-    evaluate_retriever_with_ragas,
+    asyncio,
+    evaluate_retrievers_with_ragas,
     golden_df,
     lang_client,
+    np,
     os,
+    pd,
     retriever_chains,
 ):
-    import json
+    import hashlib
+    import orjson
     from datetime import datetime
 
     # Path for saving/loading evaluation results
@@ -803,30 +1020,76 @@ def _(
     project_name = os.getenv("LANGCHAIN_PROJECT", "Building_Code_Copilot_Evaluation")
     dataset_name = f"{project_name}_evaluation_results"
 
+    # RAGAS metric columns averaged per retriever
+    METRIC_COLS = ["context_precision", "context_recall", "answer_relevancy"]
+
+    # Bump when retriever/chain/metric configuration changes, so saved results
+    # for the same golden dataset and retriever names are treated as stale
+    EVAL_CONFIG_VERSION = 1
+
+    # Fingerprint of what produced the results: golden dataset contents,
+    # retriever names and config version. Saved results are only reused on an
+    # exact match; results saved without one (older runs) are re-evaluated.
+    eval_fingerprint_hash = hashlib.sha256()
+    eval_fingerprint_hash.update(pd.util.hash_pandas_object(golden_df, index=True).to_numpy().tobytes())
+    eval_fingerprint_hash.update(repr(sorted(retriever_chains)).encode())
+    eval_fingerprint_hash.update(f"v{EVAL_CONFIG_VERSION}".encode())
+    eval_fingerprint = eval_fingerprint_hash.hexdigest()
+
     results_summary = None
 
+    def _print_summary(loaded_results, source):
+        """Print the retrievers and answer relevancy of previously saved results."""
+        print(f"✔ Loaded results for {len(loaded_results)} retrievers from {source}:")
+        print("\n".join(
+            f"   - {result['retriever']}: relevancy={result['answer_relevancy']:.3f}"
+            for result in loaded_results
+        ))
+
+    # LangSmith results dataset, looked up once and reused by the save step
+    results_dataset = None
+    results_dataset_looked_up = False
+
     # Option 1: Try to load from LangSmith first (if client available)
     if lang_client:
         try:
             print(f"🔍 Checking LangSmith for evaluation results in project '{project_name}'...")
 
+            # Look up the results dataset and fetch its examples (results are
+            # stored as metadata) concurrently: both are keyed by dataset name,
+            # so the example listing doesn't wait on the dataset lookup
+            async def fetch_langsmith_results():
+                return await asyncio.gather(
+                    asyncio.to_thread(
+                        lambda: next(iter(lang_client.list_datasets(dataset_name=dataset_name)), None)
+                    ),
+                    asyncio.to_thread(
+                        lambda: list(lang_client.list_examples(dataset_name=dataset_name, limit=100))
+                    ),
+                    return_exceptions=True
+                )
+
             # Try to find existing dataset with evaluation results
             try:
-                datasets = list(lang_client.list_datasets(dataset_name=dataset_name))
-                if datasets:
+                results_dataset, examples = asyncio.run(fetch_langsmith_results())
+                if isinstance(results_dataset, Exception):
+                    raise results_dataset
+                results_dataset_looked_up = True
+                if results_dataset is not None:
                     print(f"   Found dataset: {dataset_name}")
-                    # Try to get the latest dataset
-                    dataset = datasets[0]
 
-                    # Fetch examples from the dataset (stored as metadata)
-                    examples = list(lang_client.list_examples(dataset_id=dataset.id, limit=100))
+                    if isinstance(examples, Exception):
+                        raise examples
 
                     if examples:
                         # Reconstruct results_summary from LangSmith dataset
                         results_summary = []
                         for example in examples:
                             metadata = example.metadata or {}
-                            if metadata.get("type") == "evaluation_result":
+                            if (
+                                metadata.get("type") == "evaluation_result"
+                                and metadata.get("fingerprint") == eval_fingerprint
+                            ):
                                 results_summary.append({
                                     "retriever": metadata.get("retriever", ""),
                                     "context_precision": metadata.get("context_precision", 0),
@@ -838,9 +1101,11 @@ def _(
                                 })
 
                         if results_summary:
-                            print(f"✔ Loaded {len(results_summary)} evaluation results from LangSmith")
-                            for result in results_summary:
-                                print(f"   - {result['retriever']}: relevancy={result['answer_relevancy']:.3f}")
+                            _print_summary(results_summary, "LangSmith")
+                        else:
+                            # No results for this fingerprint: fall through to the local file
+                            print("   No matching evaluation results in dataset")
+                            results_summary = None
             except Exception as e:
                 # Dataset doesn't exist or can't be accessed
                 print(f"   No existing dataset found: {e}")
@@ -851,12 +1116,17 @@ def _(
     # Option 2: Try to load from local JSON (fallback)
     if results_summary is None and results_path.exists():
         print(f"\n📂 Loading existing evaluation results from local file: {results_path}")
-        with open(results_path, "r") as f:
-            results_summary = json.load(f)
-        print(f"✔ Loaded results for {len(results_summary)} retrievers:")
-        for result in results_summary:
-            print(f"   - {result['retriever']}: relevancy={result['answer_relevancy']:.3f}")
-        print("\n💡 To re-run evaluation, delete the file and re-run this cell.")
+        saved_results = orjson.loads(results_path.read_bytes())
+        # Results saved before fingerprinting (a bare list) can't be matched
+        # to this setup, so they count as stale like a fingerprint mismatch
+        if isinstance(saved_results, dict) and saved_results.get("fingerprint") == eval_fingerprint:
+            results_summary = saved_results["results"]
+        else:
+            print("⚠ Saved results were produced by a different (or unknown) golden dataset/retriever setup; re-running.")
+
+        if results_summary is not None:
+            _print_summary(results_summary, "local file")
+            print("\n💡 To re-run evaluation, delete the file and re-run this cell.")
 
     # Option 3: Run evaluation if no cached results found
     if results_summary is None:
@@ -864,34 +1134,40 @@ def _(
         print("   This will evaluate all 4 retrievers on the golden dataset.")
         results_summary = []
 
-        for retriever_name, rag_chain in retriever_chains.items():
-            print(f"\n{'#'*60}")
-            print(f"# Evaluating: {retriever_name}")
-            print(f"{'#'*60}")
+        # Answer with all retrievers concurrently, then score every row in one RAGAS run
+        # (nest_asyncio allows asyncio.run inside the notebook's loop)
+        all_eval_results = asyncio.run(evaluate_retrievers_with_ragas(retriever_chains, golden_df))
 
-            try:
-                # Run evaluation
-                eval_result = evaluate_retriever_with_ragas(
-                    rag_chain=rag_chain,
-                    retriever_name=retriever_name,
-                    golden_dataset_df=golden_df,
-                    delay_between_questions=0  # No rate limiting needed for OpenAI
-                )
+        # One timestamp/size for the whole run (all retrievers share one RAGAS
+        # run), reused for every result row and LangSmith example below
+        evaluated_at = datetime.now().isoformat()
+        golden_dataset_size = len(golden_df)
 
-                # Extract metrics from RAGAS results
-                ragas_scores = eval_result["ragas_results"]
-
-                # Convert EvaluationResult to pandas DataFrame to access metrics
-                ragas_df = ragas_scores.to_pandas()
+        for retriever_name in retriever_chains:
+            eval_result = all_eval_results.get(retriever_name)
+            try:
+                if isinstance(eval_result, Exception):
+                    raise eval_result
+
+                # Mean of each metric over this retriever's per-row RAGAS scores
+                # (NaN rows skipped; metrics missing from the results, or with
+                # no finite scores at all, average to 0 rather than NaN/null)
+                row_scores = eval_result["scores"]
+                metric_means = {}
+                for metric in METRIC_COLS:
+                    values = np.array(
+                        [row[metric] for row in row_scores] if row_scores and metric in row_scores[0] else [],
+                        dtype=float
+                    )
+                    finite = values[np.isfinite(values)]
+                    metric_means[metric] = float(finite.mean()) if finite.size else 0.0
 
                 result_data = {
                     "retriever": retriever_name,
-                    "context_precision": ragas_df["context_precision"].mean() if "context_precision" in ragas_df.columns else 0,
-                    "context_recall": ragas_df["context_recall"].mean() if "context_recall" in ragas_df.columns else 0,
-                    "answer_relevancy": ragas_df["answer_relevancy"].mean() if "answer_relevancy" in ragas_df.columns else 0,
+                    **metric_means,
                     "avg_latency": eval_result["latency"],
-                    "evaluated_at": datetime.now().isoformat(),
-                    "golden_dataset_size": len(golden_df),
+                    "evaluated_at": evaluated_at,
+                    "golden_dataset_size": golden_dataset_size,
                     "source": "new_evaluation"
                 }
 
@@ -900,12 +1176,20 @@ def _(
             except Exception as e:
                 print(f"\n❌ Error evaluating {retriever_name}: {str(e)}")
                 import traceback
-                traceback.print_exc()
+                traceback.print_exception(e)
                 continue
 
-        # Save results to local JSON
-        with open(results_path, "w") as f:
-            json.dump(results_summary, f, indent=2)
+        # Save results to local JSON (with their fingerprint), written to a
+        # temp file and swapped in so an interrupted save can't truncate the
+        # previous results
+        tmp_results_path = results_path.with_suffix(".json.tmp")
+        tmp_results_path.write_bytes(
+            orjson.dumps(
+                {"fingerprint": eval_fingerprint, "results": results_summary},
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        )
+        os.replace(tmp_results_path, results_path)
         print(f"\n✔ Results saved to local file: {results_path}")
 
         # Save results to LangSmith dataset (if client available)
@@ -913,38 +1197,47 @@ def _(
             try:
                 print(f"\n💾 Saving results to LangSmith dataset '{dataset_name}'...")
 
-                # Create or get dataset
-                try:
-                    dataset = lang_client.read_dataset(dataset_name=dataset_name)
-                    print(f"   Using existing dataset: {dataset.id}")
-                except:
+                # Reuse the dataset found while checking for results (no
+                # second lookup); only look it up here if that check failed
+                if not results_dataset_looked_up:
+                    results_dataset = next(iter(lang_client.list_datasets(dataset_name=dataset_name)), None)
+
+                if results_dataset is not None:
+                    print(f"   Using existing dataset: {results_dataset.id}")
+                else:
                     # Dataset doesn't exist, create it
-                    dataset = lang_client.create_dataset(
+                    results_dataset = lang_client.create_dataset(
                         dataset_name=dataset_name,
                         description="RAG technique evaluation results for building code copilot"
                     )
-                    print(f"   Created new dataset: {dataset.id}")
-
-                # Add evaluation results as examples with metadata
-                for result in results_summary:
-                    lang_client.create_example(
-                        dataset_id=dataset.id,
-                        inputs={"retriever": result["retriever"]},
-                        outputs={"status": "evaluated"},
-                        metadata={
-                            "type": "evaluation_result",
-                            "retriever": result["retriever"],
-                            "context_precision": result["context_precision"],
-                            "context_recall": result["context_recall"],
-                            "answer_relevancy": result["answer_relevancy"],
-                            "avg_latency": result["avg_latency"],
-                            "evaluated_at": result.get("evaluated_at", datetime.now().isoformat()),
-                            "golden_dataset_size": result.get("golden_dataset_size", len(golden_df))
+                    print(f"   Created new dataset: {results_dataset.id}")
+
+                # Add evaluation results as examples with metadata, uploaded in
+                # one bulk request rather than one POST per retriever
+                lang_client.create_examples(
+                    dataset_id=results_dataset.id,
+                    examples=[
+                        {
+                            "inputs": {"retriever": result["retriever"]},
+                            "outputs": {"status": "evaluated"},
+                            "metadata": {
+                                "type": "evaluation_result",
+                                "fingerprint": eval_fingerprint,
+                                "retriever": result["retriever"],
+                                "context_precision": result["context_precision"],
+                                "context_recall": result["context_recall"],
+                                "answer_relevancy": result["answer_relevancy"],
+                                "avg_latency": result["avg_latency"],
+                                "evaluated_at": result.get("evaluated_at", evaluated_at),
+                                "golden_dataset_size": result.get("golden_dataset_size", golden_dataset_size)
+                            }
                         }
-                    )
+                        for result in results_summary
+                    ]
+                )
 
                 print(f"✔ Saved {len(results_summary)} results to LangSmith dataset")
-                print(f"   View at: https://smith.langchain.com/datasets/{dataset.id}")
+                print(f"   View at: https://smith.langchain.com/datasets/{results_dataset.id}")
 
             except Exception as e:
                 print(f"   ⚠ Could not save to LangSmith: {e}")
@@ -967,9 +1260,13 @@ def _(mo):
 
 
 @app.cell
-def _(pd, results_summary):
-    # Create comparison DataFrame
-    results_df = pd.DataFrame(results_summary)
+def _(np, results_summary):
+    # Comparison rows: a handful of retrievers, so plain dicts + numpy arrays
+    # (a DataFrame is only built when saving the CSV)
+    answer_relevancy = np.fromiter((r["answer_relevancy"] for r in results_summary), dtype=np.float64)
+    context_precision = np.fromiter((r["context_precision"] for r in results_summary), dtype=np.float64)
+    context_recall = np.fromiter((r["context_recall"] for r in results_summary), dtype=np.float64)
+    avg_latencies = np.fromiter((r["avg_latency"] for r in results_summary), dtype=np.float64)
 
     # Calculate composite score (weighted combination of multiple metrics)
     # Weights can be adjusted based on priorities:
@@ -978,65 +1275,95 @@ def _(pd, results_summary):
     # - context_recall: 20% (how complete is retrieved context)
     # - latency: 10% penalty (normalized, lower is better)
 
-    # Normalize latency (0-1 scale, lower is better, so we subtract from 1)
-    max_latency = results_df['avg_latency'].max()
-    min_latency = results_df['avg_latency'].min()
-    if max_latency > min_latency:
-        # Normalize: 1 = fastest, 0 = slowest
-        results_df['latency_score'] = 1 - ((results_df['avg_latency'] - min_latency) / (max_latency - min_latency))
+    # Normalize latency (0-1 scale, lower is better, so we subtract from 1):
+    # 1 = fastest, 0 = slowest; 1.0 for all when latencies are equal. A single
+    # retriever (e.g. a debugging run) is trivially the fastest: skip the math.
+    if avg_latencies.size > 1:
+        latency_scores = 1 - (avg_latencies - avg_latencies.min()) / (np.ptp(avg_latencies) or 1.0)
     else:
-        # All same latency
-        results_df['latency_score'] = 1.0
+        latency_scores = np.ones_like(avg_latencies)
 
     # Calculate composite score
-    results_df['composite_score'] = (
-        0.50 * results_df['answer_relevancy'] +
-        0.20 * results_df['context_precision'] +
-        0.20 * results_df['context_recall'] +
-        0.10 * results_df['latency_score']
+    composite_scores = (
+        0.50 * answer_relevancy +
+        0.20 * context_precision +
+        0.20 * context_recall +
+        0.10 * latency_scores
     )
 
-    # Sort by composite score (primary ranking)
-    results_df = results_df.sort_values("composite_score", ascending=False)
+    # Rows sorted by composite score (primary ranking); copies, so the
+    # loaded/evaluated results_summary is left untouched
+    if composite_scores.size > 1:
+        composite_order = np.argsort(-composite_scores, kind="stable")
+    else:
+        composite_order = range(composite_scores.size)  # nothing to sort
+    ranked_results = [
+        {
+            **results_summary[pos],
+            "latency_score": float(latency_scores[pos]),
+            "composite_score": float(composite_scores[pos])
+        }
+        for pos in composite_order
+    ]
 
-    # Also create a version sorted by answer_relevancy for comparison
-    results_df_by_relevancy = results_df.sort_values("answer_relevancy", ascending=False)
+    # Answer-relevancy ranking for comparison, as positions into results_summary
+    if answer_relevancy.size > 1:
+        relevancy_order = np.argsort(-answer_relevancy, kind="stable")
+    else:
+        relevancy_order = composite_order
 
     print("\n" + "="*60)
     print("RAG TECHNIQUE COMPARISON RESULTS")
     print("="*60)
     print("\n📊 Metrics Table (sorted by Composite Score):")
-    print("\n" + results_df[['retriever', 'answer_relevancy', 'context_precision', 
-                              'context_recall', 'avg_latency', 'composite_score']].to_string(index=False))
+    table_columns = ["retriever", "answer_relevancy", "context_precision",
+                     "context_recall", "avg_latency", "composite_score"]
+    table_rows = [
+        [row["retriever"]] + [f"{row[column]:.3f}" for column in table_columns[1:]]
+        for row in ranked_results
+    ]
+    column_widths = [
+        max([len(column)] + [len(cells[col_idx]) for cells in table_rows])
+        for col_idx, column in enumerate(table_columns)
+    ]
+    print("\n" + "\n".join(
+        " ".join(cell.rjust(width) for cell, width in zip(cells, column_widths))
+        for cells in [table_columns] + table_rows
+    ))
     print("\n" + "="*60)
 
     # Show ranking by answer_relevancy for comparison
+    # (each ranking is joined into one string and printed with a single write)
     print("\n📈 Ranking by Answer Relevancy (single metric):")
-    for idx, row in results_df_by_relevancy.iterrows():
-        rank = list(results_df_by_relevancy.index).index(idx) + 1
-        print(f"  {rank}. {row['retriever']}: {row['answer_relevancy']:.3f}")
+    print("\n".join(
+        f"  {rank}. {results_summary[pos]['retriever']}: {answer_relevancy[pos]:.3f}"
+        for rank, pos in enumerate(relevancy_order, start=1)
+    ))
 
     print("\n📊 Ranking by Composite Score (multi-metric):")
-    for idx, row in results_df.iterrows():
-        rank = list(results_df.index).index(idx) + 1
-        print(f"  {rank}. {row['retriever']}: {row['composite_score']:.3f} "
-              f"(relevancy: {row['answer_relevancy']:.3f}, precision: {row['context_precision']:.3f}, "
-              f"recall: {row['context_recall']:.3f}, latency: {row['avg_latency']:.3f}s)")
+    print("\n".join(
+        f"  {rank}. {row['retriever']}: {row['composite_score']:.3f} "
+        f"(relevancy: {row['answer_relevancy']:.3f}, precision: {row['context_precision']:.3f}, "
+        f"recall: {row['context_recall']:.3f}, latency: {row['avg_latency']:.3f}s)"
+        for rank, row in enumerate(ranked_results, start=1)
+    ))
 
     # Find best technique (by composite score)
-    best_technique = results_df.iloc[0]
-    print(f"\n🏆 Best Technique (Composite Score): {best_technique['retriever']}")
-    print(f"   Composite Score: {best_technique['composite_score']:.3f}")
-    print(f"   Answer Relevancy: {best_technique['answer_relevancy']:.3f}")
-    print(f"   Context Precision: {best_technique['context_precision']:.3f}")
-    print(f"   Context Recall: {best_technique['context_recall']:.3f}")
-    print(f"   Avg Latency: {best_technique['avg_latency']:.3f}s")
+    best_technique = ranked_results[0]
+    print(
+        f"\n🏆 Best Technique (Composite Score): {best_technique['retriever']}\n"
+        f"   Composite Score: {best_technique['composite_score']:.3f}\n"
+        f"   Answer Relevancy: {best_technique['answer_relevancy']:.3f}\n"
+        f"   Context Precision: {best_technique['context_precision']:.3f}\n"
+        f"   Context Recall: {best_technique['context_recall']:.3f}\n"
+        f"   Avg Latency: {best_technique['avg_latency']:.3f}s"
+    )
 
     # Also show best by answer_relevancy if different
-    best_by_relevancy = results_df_by_relevancy.iloc[0]
+    best_by_relevancy = results_summary[relevancy_order[0]]
     if best_technique['retriever'] != best_by_relevancy['retriever']:
         print(f"\n📌 Best by Answer Relevancy Only: {best_by_relevancy['retriever']} ({best_by_relevancy['answer_relevancy']:.3f})")
-    return (results_df,)
+    return (ranked_results,)
 
 
 @app.cell(hide_code=True)
@@ -1054,12 +1381,13 @@ def _(mo):
 
 
 @app.cell
-def _(results_df):
+def _(ranked_results):
     # Extract metrics for each technique
-    dense_only = results_df[results_df["retriever"] == "Dense-Only"].iloc[0] if len(results_df[results_df["retriever"] == "Dense-Only"]) > 0 else None
-    bm25_only = results_df[results_df["retriever"] == "BM25-Only"].iloc[0] if len(results_df[results_df["retriever"] == "BM25-Only"]) > 0 else None
-    hybrid = results_df[results_df["retriever"] == "Hybrid"].iloc[0] if len(results_df[results_df["retriever"] == "Hybrid"]) > 0 else None
-    parent_doc = results_df[results_df["retriever"] == "Parent-Document"].iloc[0] if len(results_df[results_df["retriever"] == "Parent-Document"]) > 0 else None
+    results_by_retriever = {row["retriever"]: row for row in ranked_results}
+    dense_only = results_by_retriever.get("Dense-Only")
+    bm25_only = results_by_retriever.get("BM25-Only")
+    hybrid = results_by_retriever.get("Hybrid")
+    parent_doc = results_by_retriever.get("Parent-Document")
 
     print("\n" + "="*60)
     print("ANALYSIS")
@@ -1081,19 +1409,27 @@ def _(results_df):
         print(f"   Hybrid: {hybrid['answer_relevancy']:.3f} vs Parent-Document: {parent_doc['answer_relevancy']:.3f}")
 
     if hybrid is not None:
-        print(f"\n4. Best technique overall: {results_df.iloc[0]['retriever']}")
-        print(f"   Answer Relevancy: {results_df.iloc[0]['answer_relevancy']:.3f}")
+        print(f"\n4. Best technique overall: {ranked_results[0]['retriever']}")
+        print(f"   Answer Relevancy: {ranked_results[0]['answer_relevancy']:.3f}")
 
     print("\n" + "="*60)
     return
 
 
 @app.cell
-def _(Path, results_df):
-    # Save results to CSV
+def _(Path, ranked_results):
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    # Save results to CSV with pyarrow's writer (columns: union of result keys
+    # in first-seen order, so rows loaded from older runs still line up)
     rag_results_path = Path(__file__).parent / "results" / "rag_evaluation_results.csv"
     rag_results_path.parent.mkdir(exist_ok=True)
-    results_df.to_csv(rag_results_path, index=False)
+    result_columns = dict.fromkeys(key for row in ranked_results for key in row)
+    pacsv.write_csv(
+        pa.table({column: [row.get(column) for row in ranked_results] for column in result_columns}),
+        str(rag_results_path)
+    )
     print(f"✔ Results saved to {rag_results_path}")
     return
 